@@ -1,3 +1,9 @@
+from utils.config import STARTUP_PROFILE
+from utils import startup_profile
+
+if STARTUP_PROFILE:
+    startup_profile.enable_import_profiling()
+
 import dash
 import dash_mantine_components as dmc
 from dash import dcc, html, Input, Output, State, clientside_callback, _dash_renderer, callback
@@ -5,16 +11,28 @@ from dash import dcc, html, Input, Output, State, clientside_callback, _dash_ren
 from components.header import header_component
 from components.sidebar import sidebar_component
 from components.footer import footer_component
+from utils.figure_theme import get_figure_templates
+from services.maps.static_maps import register_static_maps
+from services.data.dataset_export import register_dataset_export
 
 _dash_renderer._set_react_version("18.2.0")
 dmc.add_figure_templates()
 
-app = dash.Dash(__name__, use_pages=True, external_stylesheets=dmc.styles.ALL)
+# Les layouts des pages sont construits à la première visite (utils.startup_profile.lazy_layout) :
+# sans suppress_callback_exceptions, Dash les construirait tous dès la première requête pour
+# valider les callbacks. Cette validation est faite hors service : python -m utils.validation_layout
+app = dash.Dash(
+    __name__,
+    use_pages=True,
+    external_stylesheets=dmc.styles.ALL,
+    suppress_callback_exceptions=True,
+)
 
 app.layout = html.Div(
     [
         dcc.Store(id="theme-store", data="dark"),  
         dcc.Store(id="sidebar-state", data=True),   
+        dcc.Store(id="figure-templates", data=get_figure_templates()),  
         dcc.Location(id="url"),
 
         dmc.MantineProvider(
@@ -54,6 +72,11 @@ clientside_callback(
 )
 
 server = app.server
+register_static_maps(server)
+register_dataset_export(server)
+
+if STARTUP_PROFILE:
+    startup_profile.print_startup_report()
 
 if __name__ == "__main__":
     app.run_server(host="0.0.0.0", port=8050)
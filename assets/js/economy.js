@@ -0,0 +1,47 @@
+window.dash_clientside = window.dash_clientside || {};
+
+window.dash_clientside.economy = {
+    // Même dégradé que utils/colors.get_node_color : bleu (-1) -> blanc (0) -> rouge (1)
+    correlationColor: function (corr) {
+        const blue = [0, 0, 255];
+        const white = [255, 255, 255];
+        const red = [255, 0, 0];
+        const rgb = corr < 0
+            ? blue.map((c, i) => Math.trunc(c + (corr + 1) * (white[i] - c)))
+            : white.map((c, i) => Math.trunc(c + corr * (red[i] - c)));
+        return "#" + rgb.map((c) => c.toString(16).padStart(2, "0")).join("");
+    },
+
+    // Colore les voisins du nœud cliqué à partir des corrélations embarquées dans ses données
+    highlightCorrelations: function (tappedNode, stylesheet, theme) {
+        if (!stylesheet) {
+            return window.dash_clientside.no_update;
+        }
+        const textColor = theme === "dark" ? "#ffffff" : "#000000";
+        // On retire les règles posées par un clic précédent
+        const base = stylesheet.filter((rule) => !rule.selector.startsWith("node[id = "));
+        if (!tappedNode || !tappedNode.correlations) {
+            return base;
+        }
+
+        const rules = [{
+            selector: `node[id = "${tappedNode.id}"]`,
+            style: {
+                "background-color": "red",
+                "border-width": 3,
+                "border-color": "black",
+                "color": textColor
+            }
+        }];
+        for (const [variable, corr] of Object.entries(tappedNode.correlations)) {
+            rules.push({
+                selector: `node[id = "${variable}"]`,
+                style: {
+                    "background-color": window.dash_clientside.economy.correlationColor(corr),
+                    "color": textColor
+                }
+            });
+        }
+        return base.concat(rules);
+    }
+};
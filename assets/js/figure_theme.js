@@ -0,0 +1,17 @@
+window.dash_clientside = window.dash_clientside || {};
+
+window.dash_clientside.theme = {
+    // Applique le template du thème courant à la figure affichée, sans repasser par le serveur.
+    // Déclenché aussi par ses propres sorties : une figure déjà au bon template est laissée telle quelle.
+    swapFigureTemplate: function (theme, figure, templates) {
+        if (!figure || !templates) {
+            return window.dash_clientside.no_update;
+        }
+        const template = templates[theme === "dark" ? "dark" : "light"];
+        const layout = figure.layout || {};
+        if (JSON.stringify(layout.template) === JSON.stringify(template)) {
+            return window.dash_clientside.no_update;
+        }
+        return Object.assign({}, figure, { layout: Object.assign({}, layout, { template: template }) });
+    }
+};
@@ -1,14 +1,16 @@
 import plotly.graph_objects as go
 import pandas as pd
-import json
 import dash_mantine_components as dmc
 import dash_cytoscape as cyto
 
 import dash_leaflet as dl
 from dash import html
 
+from utils.figure_cache import cached_figure
+from services.data.geojson_io import read_geojson
 from services.data.process_economic_data import get_unemployment_by_city, get_overall_unemployment_rate, get_unemployment_by_age, get_unemployment_by_qualification, get_unemployment_by_sex, get_combined_cpi_salary_data, compute_partial_correlation_matrix
 
+@cached_figure(sources=["services/data/raw/UnemploymentRate.csv"])
 def create_unemployment_bar_chart(theme="mantine_light"):
     """
     Crée un bar chart personnalisé avec Plotly Graph Objects pour le taux de chômage par ville.
@@ -194,7 +196,6 @@ def create_unemployment_residents_line_chart(category="Qualification"):
 # Folium map
 
 import folium
-import json
 
 def get_fill_color(pop):
     """
@@ -276,8 +277,7 @@ def create_folium_map(geojson_path="services/data/processed/PlanningAreaWithSala
       - Deux légendes HTML indiquant respectivement l'échelle de population et l'échelle de salaire médian.
     """
     # Charger le GeoJSON
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        geojson = json.load(f)
+    geojson = read_geojson(geojson_path)
     
     # Créer la carte centrée sur Singapore
     m = folium.Map(location=[1.3521, 103.8198], zoom_start=11)
@@ -426,10 +426,23 @@ def create_cpi_salary_line_chart_mantine(salary_line_width=5, cpi_line_width=2,
     )
     return chart
 
-def create_cytoscape_graph(alpha=0.05, theme="light"):
-    adj_matrix, corr_partial, var_names = compute_partial_correlation_matrix(alpha=alpha)
-
-    nodes = [{"data": {"id": var, "label": var}} for var in var_names]
+def create_cytoscape_graph(alpha=0.05, theme="light", method="inverse", correction="bonferroni"):
+    adj_matrix, corr_partial, var_names = compute_partial_correlation_matrix(alpha=alpha, method=method, correction=correction)
+
+    # Chaque nœud embarque sa ligne de corrélations partielles : le surlignage
+    # des voisins au clic se fait côté navigateur, sans appel serveur
+    nodes = [
+        {
+            "data": {
+                "id": var,
+                "label": var,
+                "correlations": {
+                    other: float(corr_partial[i, j]) for j, other in enumerate(var_names) if j != i
+                },
+            }
+        }
+        for i, var in enumerate(var_names)
+    ]
     edges = []
 
     for i in range(len(var_names)):
@@ -4,7 +4,9 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from services.data.process_education_data import get_aggregated_data, get_line_chart_data, get_admission_trade_data, get_institution_trends_data, compute_corr_institution
+from utils.figure_cache import cached_figure
 
+@cached_figure(sources=["services/data/raw/GraduateEmploymentSurvey.csv"])
 def create_bar_chart_figure(detail_level="global", parent_value=None, year=2022, template="mantine_light"):
     """
     Crée une figure Plotly avec des barres arrondies et une légende de couleur personnalisée pour `employment_rate_overall`.
@@ -71,6 +73,7 @@ def create_bar_chart_figure(detail_level="global", parent_value=None, year=2022,
     return fig
 
 
+@cached_figure
 def create_line_chart_figure(metric="intake", gender="both", template="mantine_light", csv_path="services/data/processed/course_data.csv", hover_mode="closest"):
     """
     Crée un graphique linéaire interactif avec Plotly Graph Objects pour l'évolution des cours selon la métrique sélectionnée.
@@ -132,6 +135,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 
+@cached_figure(sources=["services/data/processed/updated_annual_student_intake_enrolment.csv"])
 def create_admission_trends_figure(show_regression=False, marker_size=8, template="mantine_light"):
     """
     Crée un graphique interactif illustrant l'évolution des admissions universitaires à Singapour.
@@ -219,6 +223,7 @@ def create_admission_trends_figure(show_regression=False, marker_size=8, templat
 
 
 
+@cached_figure
 def create_institution_trends_figure(metric="enrolment", institutions=None, template="mantine_light", csv_path="services/data/processed/institution_data.csv", hover_mode="closest"):
     """
     Crée un graphique linéaire interactif avec Plotly Graph Objects pour l'évolution de la métrique sélectionnée par institution.
@@ -280,6 +285,7 @@ def create_institution_trends_figure(metric="enrolment", institutions=None, temp
     
     return fig
 
+@cached_figure(sources=["services/data/raw/Intake by Institutions.csv", "services/data/raw/Enrolment by Institutions.csv"])
 def create_corr_institution_figure(institutions=["sit", "smu", "suss", "sutd", "nus", "ntu"], template="mantine_light", mode="intake"):
     intake_corr, enrolment_corr, corr_intake_rate = compute_corr_institution()
 
@@ -3,11 +3,13 @@ import plotly.graph_objects as go
 from dash import dash_table
 from dash import html
 import folium
-import json
 import dash_mantine_components as dmc
+import numpy as np
 import pandas as pd
 
-from services.data.process_data_immo import process_data_immo, process_data_table_intro, process_data_line_history
+from services.data.process_data_immo import process_data_immo, process_data_table_intro, get_town_price_store
+from utils.figure_cache import cached_figure
+from services.data.geojson_io import read_geojson
 
 
 import dash_mantine_components as dmc
@@ -177,8 +179,7 @@ def create_folium_map(geojson_path="services/data/processed/PriceWithSalaryUpdat
       - Une légende indiquant l'échelle des prix/m².
     """
     # Charger le GeoJSON
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        geojson = json.load(f)
+    geojson = read_geojson(geojson_path)
 
     # Créer la carte centrée sur Singapore
     m = folium.Map(location=[1.3521, 103.8198], zoom_start=11)
@@ -353,8 +354,7 @@ def create_folium_map_resale(geojson_path="services/data/processed/PriceWithSala
       - Une légende indiquant l'échelle des prix/m².
     """
     # Charger le GeoJSON
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        geojson = json.load(f)
+    geojson = read_geojson(geojson_path)
 
     # Créer la carte centrée sur Singapore
     m = folium.Map(location=[1.3521, 103.8198], zoom_start=11)
@@ -447,13 +447,14 @@ def create_folium_map_resale(geojson_path="services/data/processed/PriceWithSala
 # création de la figure de l'évolution des prix en fonction du quartier cliqué sur la map
 ##########################################
 
+@cached_figure(sources=["services/data/processed/price_pred.csv"])
 def create_line_chart_figure_history_price(town = "Ang Mo Kio", template = "mantine_light"):
     """
-    Crée une figure Plotly Express (line chart) pour l'évolution des prix.
+    Crée une figure Plotly (line chart) pour l'évolution des prix.
+    La série du quartier est lue directement dans le store des agrégats par quartier.
     """
-    df_agg = process_data_line_history()
-    
-    df_filtered = df_agg[df_agg["town"] == town]
+    history = get_town_price_store()["history"]
+    df_filtered = history.get(town, pd.DataFrame(columns=["Date", "price_m2"]))
     # data_list = df_filtered[["Date", "price_m2"]].to_dict(orient="records")
 
     # return dmc.LineChart(
@@ -471,33 +472,30 @@ def create_line_chart_figure_history_price(town = "Ang Mo Kio", template = "mant
     #     unit=" SGD",
     # )
 
-    fig = px.line(
-        df_filtered,
-        x="Date",
-        y="price_m2",
-        title="Price per m2 depending on the date",
-        template=template
+    fig = go.Figure(
+        data=go.Scatter(x=df_filtered["Date"], y=df_filtered["price_m2"], mode="lines"),
+        layout=dict(
+            title="Price per m2 depending on the date",
+            xaxis_title="Date",
+            yaxis_title="price_m2",
+            template=template,
+        ),
     )
     return fig
 
 
+@cached_figure(sources=["services/data/processed/price_pred.csv"])
 def create_bar_chart_figure(selected_town="Ang Mo Kio", template = "mantine_light"):
-    df = process_data_line_history()
-
-    # Filtrer les données pour 2024
-    df_2024 = df[df["Year"] == 2024].groupby("town")["price_m2"].mean().reset_index()
-
-    # Ajouter une colonne de couleur pour mettre en évidence le quartier sélectionné
-    df_2024["color"] = df_2024["town"].apply(lambda x: "red" if x == selected_town else "lightgray")
-
-    fig = px.bar(
-        df_2024,
-        x="town",
-        y="price_m2",
-        title="Average price for m² in 2024",
-        color="color",
-        color_discrete_map="identity",
-        template=template
+    # Moyennes 2024 pré-calculées par quartier
+    store = get_town_price_store()
+    towns, means_2024 = store["towns"], store["means_2024"]
+
+    # Mettre en évidence le quartier sélectionné
+    colors = np.where(towns == selected_town, "red", "lightgray")
+
+    fig = go.Figure(
+        data=go.Bar(x=towns, y=means_2024, marker_color=colors),
+        layout=dict(title="Average price for m² in 2024", template=template),
     )
 
     fig.update_layout(
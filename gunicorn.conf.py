@@ -0,0 +1,88 @@
+# Configuration gunicorn : gunicorn -c gunicorn.conf.py app:server
+#
+# Variables d'environnement (toutes optionnelles) :
+#   PORT / BIND              adresse d'écoute (défaut 0.0.0.0:8050)
+#   GUNICORN_WORKER_CLASS    sync, gthread (défaut) ou gevent
+#   GUNICORN_WORKERS         nombre de workers (défaut : 2 x CPU + 1, plafonné à 8)
+#   GUNICORN_THREADS         threads par worker gthread (défaut 4)
+#   CACHE_DIR                dossier des caches partagés entre workers (défaut /dev/shm/open-data-city)
+
+import importlib.util
+import os
+
+WORKER_CLASSES = ("sync", "gthread", "gevent")
+
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+if worker_class not in WORKER_CLASSES:
+    raise ValueError(f"GUNICORN_WORKER_CLASS must be one of {WORKER_CLASSES}, got {worker_class!r}")
+if worker_class == "gevent" and importlib.util.find_spec("gevent") is None:
+    print("⚠️ gevent n'est pas installé : utilisation des workers gthread")
+    worker_class = "gthread"
+
+if worker_class == "gevent":
+    # Avec preload_app, l'application est importée dans le master : la bibliothèque
+    # standard doit être patchée avant cet import (et avant tout autre import ici),
+    # sinon les verrous et sockets créés au chargement restent bloquants dans les workers.
+    from gevent import monkey
+
+    monkey.patch_all()
+
+import gc
+import multiprocessing
+import tempfile
+
+bind = os.environ.get("BIND", f"0.0.0.0:{os.environ.get('PORT', '8050')}")
+
+# Importer l'application dans le master avant de forker les workers
+preload_app = True
+
+workers = int(os.environ.get("GUNICORN_WORKERS", min(2 * multiprocessing.cpu_count() + 1, 8)))
+# gthread : les callbacks qui attendent des E/S libèrent le GIL, les threads partagent les caches du worker
+threads = int(os.environ.get("GUNICORN_THREADS", 4)) if worker_class == "gthread" else 1
+# gevent : nombre de connexions simultanées par worker
+worker_connections = 200
+
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Recyclage périodique des workers (fuites mémoire) ; peu coûteux grâce au preload
+max_requests = 1000
+max_requests_jitter = 100
+
+# Battement de cœur des workers en mémoire partagée plutôt que sur le disque
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+# Caches disque partagés par tous les workers (figures, prédictions). Ces variables
+# doivent être définies avant l'import de l'application (utils.config les lit à l'import).
+CACHE_DIR = os.environ.get(
+    "CACHE_DIR",
+    os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "open-data-city"),
+)
+os.environ.setdefault("FIGURE_CACHE_DIR", os.path.join(CACHE_DIR, "figures"))
+os.environ.setdefault("PREDICTION_CACHE_DIR", os.path.join(CACHE_DIR, "predictions"))
+
+
+def on_starting(server):
+    # Le modèle CatBoost est chargé une fois dans le master : les workers forkés
+    # héritent de ses pages mémoire en copy-on-write au lieu de le recharger chacun.
+    from models.pred_immobilier import preload_model
+
+    preload_model()
+
+    # Jeux de données du catalogue et layouts des pages (figures, GeoJSON) chargés
+    # dans le master : chaque worker démarre avec sa copie des caches déjà remplie
+    import dash
+    from utils.data_config import load_data_config, get_dataset_metadata
+
+    for dataset in load_data_config():
+        get_dataset_metadata(dataset["id"])
+    for page in dash.page_registry.values():
+        if callable(page["layout"]):
+            page["layout"]()
+
+    # Les objets chargés ne sont plus suivis par le ramasse-miettes : ses passages
+    # dans les workers ne réécrivent pas leurs en-têtes, et les pages restent partagées
+    gc.freeze()
+    server.log.info("Application préchargée (modèle, jeux de données, layouts)")
@@ -1,16 +1,260 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from itertools import product
+
 import joblib
+import numpy as np
 import pandas as pd
+from catboost import CatBoostRegressor, Pool
+
+from utils.cache import TTLCache, DiskStore, CacheStats
+from utils.config import PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL, PREDICTION_CACHE_DIR, PREDICTION_CACHE_DISK_ENTRIES
 
-# Charger le modèle une seule fois au démarrage
 MODEL_PATH = "models/catboost_model_entraine_compressed.pkl"
-model = joblib.load(MODEL_PATH)
+# Formats plus rapides à charger, utilisés en priorité s'ils existent (voir export_fast_models)
+NATIVE_MODEL_PATH = "models/catboost_model_entraine.cbm"
+UNCOMPRESSED_MODEL_PATH = "models/catboost_model_entraine.pkl"
+
+# Le modèle est chargé à la première prédiction (ou par preload_model), pas à l'import
+_model = None
+_model_version = None
+_model_lock = threading.Lock()
+
+# Cache des prédictions : clé = hash du vecteur de features complet + version du modèle
+_prediction_cache = TTLCache(maxsize=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL)
+_prediction_disk = (DiskStore(PREDICTION_CACHE_DIR, ttl=PREDICTION_CACHE_TTL, suffix=".txt",
+                              max_entries=PREDICTION_CACHE_DISK_ENTRIES)
+                    if PREDICTION_CACHE_DIR else None)
+_prediction_stats = CacheStats()
+
+# Colonnes attendues par le modèle, dans l'ordre d'entraînement
+FEATURES = ['month', 'year', 'town', 'flat_type', 'street_name',
+            'storey_range', 'floor_area_sqm', 'flat_model', 'lease_commence_date',
+            'remaining_lease_years']
+
+CAT_FEATURES = ['town', 'flat_type', 'street_name', 'storey_range', 'flat_model']
+NUM_FEATURES = [col for col in FEATURES if col not in CAT_FEATURES]
+
+# Valeurs par défaut utilisées quand l'utilisateur ne les renseigne pas
+DEFAULT_FEATURES = {
+    "month": 1,  # Janvier par défaut
+    "year": 2025,  # Année suivante
+    "storey_range": "04 TO 06",
+    "flat_model": "Apartment",
+    "lease_commence_date": 2000,
+    "remaining_lease_years": 6.5,
+}
+
+STOREY_RANGES = [f"{low:02d} TO {low + 2:02d}" for low in range(1, 50, 3)]
+
+
+def _load_model():
+    if os.path.exists(NATIVE_MODEL_PATH):
+        native_model = CatBoostRegressor()
+        native_model.load_model(NATIVE_MODEL_PATH)
+        return native_model, NATIVE_MODEL_PATH
+    if os.path.exists(UNCOMPRESSED_MODEL_PATH):
+        return joblib.load(UNCOMPRESSED_MODEL_PATH), UNCOMPRESSED_MODEL_PATH
+    return joblib.load(MODEL_PATH), MODEL_PATH
+
+
+def get_model():
+    """ Retourne le modèle CatBoost, chargé une seule fois par processus (thread-safe). """
+    global _model, _model_version
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                loaded_model, path = _load_model()
+                stat = os.stat(path)
+                _model_version = f"{os.path.basename(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+                _model = loaded_model
+    return _model
+
+
+def get_model_version():
+    """ Identifiant du modèle chargé (fichier, mtime, taille), utilisé dans les clés de cache. """
+    get_model()
+    return _model_version
+
+
+def preload_model():
+    """
+    Charge le modèle immédiatement.
+    Appelé dans le master gunicorn (preload) pour que les workers forkés partagent
+    les pages mémoire du modèle en copy-on-write.
+    """
+    get_model()
+
+
+def export_fast_models():
+    """
+    Exporte le modèle au format natif CatBoost (.cbm) et en pickle non compressé,
+    tous deux plus rapides à charger que le pickle compressé.
+    """
+    fast_model = get_model()
+    fast_model.save_model(NATIVE_MODEL_PATH)
+    joblib.dump(fast_model, UNCOMPRESSED_MODEL_PATH, compress=0)
+    print(f"✅ Modèle exporté dans {NATIVE_MODEL_PATH} et {UNCOMPRESSED_MODEL_PATH}")
+
+
+def _prediction_key(row, version):
+    # Forme canonique : valeurs numériques en float, catégories en texte, clés triées
+    canonical = {
+        col: float(value) if isinstance(value, (int, float, np.number)) else str(value)
+        for col, value in row.items()
+    }
+    payload = json.dumps({"model": version, "features": canonical}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _predict_with_cache(data, predict_fn):
+    """
+    Sert chaque ligne depuis le cache de prédictions, et n'appelle predict_fn
+    (en un seul lot) que pour les lignes absentes du cache.
+    """
+    version = get_model_version()
+    keys = [_prediction_key(row, version) for row in data.to_dict(orient="records")]
+    predictions = np.empty(len(keys), dtype=float)
+    missing = []
+
+    for i, key in enumerate(keys):
+        value = _prediction_cache.get(key)
+        if value is None and _prediction_disk is not None:
+            stored = _prediction_disk.get(key)
+            if stored is not None:
+                value = float(stored)
+                _prediction_cache.set(key, value)
+        if value is None:
+            _prediction_stats.miss()
+            missing.append(i)
+        else:
+            _prediction_stats.hit()
+            predictions[i] = value
+
+    if missing:
+        computed = np.asarray(predict_fn(data.iloc[missing]), dtype=float)
+        for i, value in zip(missing, computed):
+            predictions[i] = value
+            _prediction_cache.set(keys[i], float(value))
+            if _prediction_disk is not None:
+                _prediction_disk.set(keys[i], repr(float(value)))
+
+    return predictions
+
+
+def get_prediction_cache_stats():
+    """ Retourne les compteurs hits/misses et le taux de hit du cache de prédictions. """
+    stats = _prediction_stats.as_dict()
+    stats["entries"] = len(_prediction_cache)
+    return stats
+
 
 def predict_immobilier(data):
-    """ Prédit le prix immobilier à partir des données fournies. """
+    """ Prédit le prix immobilier à partir des données fournies (via le cache de prédictions). """
     if not isinstance(data, pd.DataFrame):
         raise ValueError("Input data must be a pandas DataFrame")
-    
+
     # Faire la prédiction
-    prediction = model.predict(data)
-    
-    return prediction
\ No newline at end of file
+    prediction = _predict_with_cache(data, get_model().predict)
+
+    return prediction
+
+
+def build_feature_frame(listings):
+    """
+    Construit et valide le DataFrame de features pour un lot d'annonces.
+
+    Paramètres :
+      - listings : liste de dictionnaires (une annonce par élément), dictionnaire
+        de colonnes ({"town": [...], "floor_area_sqm": [...], ...}) ou DataFrame.
+
+    Les colonnes absentes ou vides reçoivent les valeurs de DEFAULT_FEATURES.
+    Lève une ValueError si une feature obligatoire manque ou n'est pas numérique.
+    """
+    if isinstance(listings, pd.DataFrame):
+        df = listings.copy()
+    elif isinstance(listings, dict):
+        df = pd.DataFrame(listings)
+    else:
+        df = pd.DataFrame.from_records(list(listings))
+
+    if df.empty:
+        raise ValueError("At least one listing is required")
+
+    for col, default in DEFAULT_FEATURES.items():
+        df[col] = df[col].fillna(default) if col in df.columns else default
+
+    missing = [col for col in FEATURES if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing features: {missing}")
+
+    for col in NUM_FEATURES:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    invalid = [col for col in FEATURES if df[col].isna().any()]
+    if invalid:
+        raise ValueError(f"Missing or invalid values for: {invalid}")
+
+    # Les catégories sont encodées une seule fois pour tout le lot
+    df[CAT_FEATURES] = df[CAT_FEATURES].astype(str)
+
+    return df[FEATURES].reset_index(drop=True)
+
+
+def predict_immobilier_batch(listings):
+    """
+    Prédit le prix de plusieurs annonces en un seul appel CatBoost.
+
+    Paramètres :
+      - listings : voir build_feature_frame (liste de dicts, colonnes ou DataFrame).
+
+    Retourne un dictionnaire :
+      - predictions : tableau numpy des prix prédits, dans l'ordre des annonces.
+      - features : DataFrame des features effectivement utilisées.
+      - prepare_s / predict_s : temps de validation et d'inférence (cache compris, en secondes).
+      - per_row_s : temps total ramené à une annonce.
+    """
+    start = time.perf_counter()
+    features = build_feature_frame(listings)
+    prepared = time.perf_counter()
+
+    model = get_model()
+    predictions = _predict_with_cache(
+        features, lambda rows: model.predict(Pool(rows, cat_features=CAT_FEATURES))
+    )
+    done = time.perf_counter()
+
+    return {
+        "predictions": predictions,
+        "features": features,
+        "prepare_s": prepared - start,
+        "predict_s": done - prepared,
+        "per_row_s": (done - start) / len(features),
+    }
+
+
+def build_scenario_grid(base, storey_ranges=None, floor_areas=None):
+    """
+    Génère une grille de scénarios (chaque étage × chaque surface) à partir d'une annonce de base.
+
+    Paramètres :
+      - base : dictionnaire de features communes (town, flat_type, street_name, ...).
+      - storey_ranges : liste de tranches d'étage (par défaut STOREY_RANGES).
+      - floor_areas : liste de surfaces en m² (par défaut la surface de base).
+
+    Retourne un dictionnaire de colonnes, directement utilisable par predict_immobilier_batch.
+    """
+    storey_ranges = storey_ranges or STOREY_RANGES
+    floor_areas = floor_areas or [base["floor_area_sqm"]]
+
+    grid = list(product(storey_ranges, floor_areas))
+    columns = {col: [value] * len(grid) for col, value in base.items()}
+    columns["storey_range"] = [storey for storey, _ in grid]
+    columns["floor_area_sqm"] = [area for _, area in grid]
+    return columns
+
+
+if __name__ == "__main__":
+    export_fast_models()
@@ -1,103 +1,186 @@
 import dash
 import dash_mantine_components as dmc
-from dash import dcc, html, Input, Output, callback, State
+from dash import dcc, html, Input, Output, callback, State, ctx
 from dash_iconify import DashIconify
-import math
-from utils.data_config import get_grouped_dataset_options, get_dataset_by_id, load_dataset
+from utils.config import DATA_PAGE_SIZE
+from utils.data_config import get_grouped_dataset_options, get_dataset_by_id, get_dataset_metadata, get_catalog_totals
+from services.data.dataset_query import query_dataset
+from services.data.dataset_export import export_url
+from utils.startup_profile import lazy_layout
 
 dash.register_page(__name__, path="/data")
 
-layout = dmc.Container(
-    fluid=True,
-    p="xl", 
-    children=[
-        dmc.Group(
-            align="center",
-            justify="center",
-            children=[
-                DashIconify(icon="mdi:table", height=40, color="#228be6"),
-                dmc.Title("Open Data Table", order=1),
-            ],
-            style={"marginBottom": "1rem"},
-        ),
-        dmc.Text(
-            "Explore the datasets we used in this project. Click on a dataset to view its description and data.",
-            size="md",
-            style={"marginTop": "0.5rem", "margin" : "auto", "textAlign": "center",  "marginBottom": "0.5rem"},
-        ),
-        dmc.Space(h="md"),
-
-        dmc.Select(
-            id="dataset-select",
-            data=get_grouped_dataset_options(),
-            placeholder="Search for a dataset",
-            searchable=True,
-            style={"width": "30%", "margin": "auto", "marginBottom": "1rem"}
-        ),
-        
-        dmc.Space(h="md"),
+@lazy_layout
+def layout():
+    return dmc.Container(
+        fluid=True,
+        p="xl", 
+        children=[
+            dmc.Group(
+                align="center",
+                justify="center",
+                children=[
+                    DashIconify(icon="mdi:table", height=40, color="#228be6"),
+                    dmc.Title("Open Data Table", order=1),
+                ],
+                style={"marginBottom": "1rem"},
+            ),
+            dmc.Text(
+                "Explore the datasets we used in this project. Click on a dataset to view its description and data.",
+                size="md",
+                style={"marginTop": "0.5rem", "margin" : "auto", "textAlign": "center",  "marginBottom": "0.5rem"},
+            ),
+            dmc.Space(h="md"),
+
+            dmc.Select(
+                id="dataset-select",
+                data=get_grouped_dataset_options(),
+                placeholder="Search for a dataset",
+                searchable=True,
+                style={"width": "30%", "margin": "auto", "marginBottom": "1rem"}
+            ),
         
-        html.Div(
-            dmc.Table(
-                id="data-table",
-                striped=True,
-                highlightOnHover=True,
-                withColumnBorders=True,
-                data={}  
+            dmc.Space(h="md"),
+
+            # Recherche, filtre par colonne et tri, appliqués côté serveur
+            dmc.Group(
+                justify="center",
+                align="flex-end",
+                children=[
+                    dmc.TextInput(
+                        id="table-search",
+                        label="Search",
+                        placeholder="Search all columns",
+                        debounce=300,
+                        leftSection=DashIconify(icon="tabler:search"),
+                    ),
+                    dmc.Select(id="table-filter-column", label="Filter column", data=[], clearable=True),
+                    dmc.TextInput(id="table-filter-value", label="Contains", debounce=300),
+                    dmc.Select(id="table-sort-column", label="Sort by", data=[], clearable=True),
+                    dmc.SegmentedControl(
+                        id="table-sort-order",
+                        value="asc",
+                        data=[
+                            {"value": "asc", "label": "Ascending"},
+                            {"value": "desc", "label": "Descending"},
+                        ],
+                    ),
+                ],
+                style={"marginBottom": "1rem"},
+            ),
+
+            dmc.Text(id="table-row-count", size="sm", c="dimmed", style={"textAlign": "center"}),
+
+            # Téléchargement de la vue courante (filtre, recherche et tri compris)
+            dmc.Group(
+                id="table-export",
+                justify="center",
+                gap="md",
+                children=[
+                    dmc.Anchor(
+                        f"Download {label}",
+                        id=f"table-export-{fmt}",
+                        href="",
+                        target="_blank",
+                        size="sm",
+                    )
+                    for fmt, label in (("csv", "CSV"), ("jsonl", "JSON Lines"), ("parquet", "Parquet"))
+                ],
+                style={"display": "none"},
+            ),
+            dmc.Space(h="sm"),
+
+            html.Div(
+                dmc.Table(
+                    id="data-table",
+                    striped=True,
+                    highlightOnHover=True,
+                    withColumnBorders=True,
+                    data={}  
+                ),
+                style={"overflowX": "auto", "width": "100%"}
             ),
-            style={"overflowX": "auto", "width": "100%"}
-        ),
         
-        dmc.Space(h="md"),
+            dmc.Space(h="md"),
         
-        dmc.Pagination(
-            id="table-pagination",
-            total=1,  
-            boundaries=1,
-            value=1,  
-            style={"margin": "auto"}
-        ),
+            dmc.Pagination(
+                id="table-pagination",
+                total=1,  
+                boundaries=1,
+                value=1,  
+                style={"margin": "auto"}
+            ),
         
-        dmc.Space(h="md"),
+            dmc.Space(h="md"),
         
-        html.Div(
-            id="dataset-description",
-            style={"width": "100%", "margin": "auto", "padding": "1rem", "border": "1px solid #ccc", "borderRadius": "8px"}
-        ),
-    ],
-    style={"padding": "1rem"}
+            html.Div(
+                id="dataset-description",
+                style={"width": "100%", "margin": "auto", "padding": "1rem", "border": "1px solid #ccc", "borderRadius": "8px"}
+            ),
+        ],
+        style={"padding": "1rem"}
+    )
+
+@callback(
+    Output("table-filter-column", "data"),
+    Output("table-filter-column", "value"),
+    Output("table-sort-column", "data"),
+    Output("table-sort-column", "value"),
+    Output("table-search", "value"),
+    Output("table-filter-value", "value"),
+    Input("dataset-select", "value"),
 )
+def update_query_controls(dataset_id):
+    dataset = get_dataset_by_id(dataset_id) if dataset_id else None
+    if not dataset:
+        return [], None, [], None, "", ""
+
+    # Colonnes lues dans le catalogue : pas besoin de charger le fichier
+    metadata = get_dataset_metadata(dataset_id)
+    columns = metadata["columns"] if metadata else []
+    return columns, None, columns, None, "", ""
+
 
 @callback(
     Output("data-table", "data"),
     Output("table-pagination", "total"),
+    Output("table-pagination", "value"),
+    Output("table-row-count", "children"),
     Output("dataset-description", "children"),
     Input("dataset-select", "value"),
-    Input("table-pagination", "value")
+    Input("table-pagination", "value"),
+    Input("table-search", "value"),
+    Input("table-filter-column", "value"),
+    Input("table-filter-value", "value"),
+    Input("table-sort-column", "value"),
+    Input("table-sort-order", "value"),
 )
-def update_data_table(dataset_id, page):
+def update_data_table(dataset_id, page, search, filter_column, filter_value, sort_by, sort_order):
     if not dataset_id:
-        return {}, 1, "Please select a dataset from the dropdown above."
-    
+        return {}, 1, 1, catalog_summary(), "Please select a dataset from the dropdown above."
+
     dataset = get_dataset_by_id(dataset_id)
     if not dataset:
-        return {}, 1, "Dataset not found."
-    
+        return {}, 1, 1, "", "Dataset not found."
+
+    # Nouvelle requête : retour à la première page
+    if ctx.triggered_id != "table-pagination":
+        page = 1
+
     try:
-        df = load_dataset(dataset_id)
+        result = query_dataset(
+            dataset["csv_path"],
+            page=page,
+            page_size=DATA_PAGE_SIZE,
+            search=search,
+            filter_column=filter_column,
+            filter_value=filter_value,
+            sort_by=sort_by,
+            ascending=sort_order != "desc",
+        )
     except Exception as e:
-        return {}, 1, f"Error loading data: {e}"
-    
-    head = list(df.columns)
-    body = df.values.tolist()
-    
-    rows_per_page = 10
-    total_pages = math.ceil(len(body) / rows_per_page)
-    page = max(1, page)
-    start = (page - 1) * rows_per_page
-    end = start + rows_per_page
-    body_paginated = body[start:end]
-    
+        return {}, 1, 1, "", f"Error loading data: {e}"
+
     description_text = [
         dmc.Text("Dataset description", size="lg"),
         dcc.Markdown(
@@ -105,13 +188,77 @@ def update_data_table(dataset_id, page):
             style={"textAlign": "justify", "lineHeight": "1.6"}
         ),
         dmc.Space(h="sm"),
-        dmc.Anchor("Data Source", href=dataset["source_link"], target="_blank", size="md")
+        dmc.Anchor("Data Source", href=dataset["source_link"], target="_blank", size="md"),
+        *schema_summary(get_dataset_metadata(dataset_id)),
     ]
-    
+
     table_data = {
         "caption": "",
-        "head": head,
-        "body": body_paginated
+        "head": result["columns"],
+        "body": result["rows"]
+    }
+
+    row_count = f"{result['total_rows']:,} rows"
+
+    return table_data, result["total_pages"], result["page"], row_count, description_text
+
+
+@callback(
+    Output("table-export-csv", "href"),
+    Output("table-export-jsonl", "href"),
+    Output("table-export-parquet", "href"),
+    Output("table-export", "style"),
+    Input("dataset-select", "value"),
+    Input("table-search", "value"),
+    Input("table-filter-column", "value"),
+    Input("table-filter-value", "value"),
+    Input("table-sort-column", "value"),
+    Input("table-sort-order", "value"),
+)
+def update_export_links(dataset_id, search, filter_column, filter_value, sort_by, sort_order):
+    if not dataset_id or not get_dataset_by_id(dataset_id):
+        return "", "", "", {"display": "none"}
+
+    query = {
+        "search": search,
+        "filter_column": filter_column,
+        "filter_value": filter_value if filter_column else None,
+        "sort_by": sort_by,
+        "ascending": sort_order != "desc",
     }
-    
-    return table_data, total_pages, description_text
+    links = [export_url(dataset_id, fmt, **query) for fmt in ("csv", "jsonl", "parquet")]
+    return *links, {}
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def catalog_summary():
+    totals = get_catalog_totals()
+    return (
+        f"{totals['available']} of {totals['datasets']} datasets available · "
+        f"{totals['rows']:,} rows · {format_bytes(totals['bytes'])}"
+    )
+
+
+def schema_summary(metadata):
+    if not metadata:
+        return []
+    return [
+        dmc.Space(h="sm"),
+        dmc.Text(
+            f"{metadata['rows']:,} rows · {len(metadata['columns'])} columns · {format_bytes(metadata['bytes'])}",
+            size="sm",
+            c="dimmed",
+        ),
+        dmc.Text(
+            "Schema: " + ", ".join(f"{col} ({dtype})" for col, dtype in metadata["dtypes"].items()),
+            size="sm",
+            c="dimmed",
+        ),
+    ]
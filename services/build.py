@@ -0,0 +1,372 @@
+"""
+Build incrémental des fichiers traités : python -m services.build [cibles...]
+
+Chaque cible déclare la fonction qui la produit, ses fichiers d'entrée et ses
+fichiers de sortie. Les dépendances entre cibles sont déduites des fichiers
+(une cible dépend de celles qui produisent ses entrées). Une cible n'est
+reconstruite que si le hash du contenu d'une de ses entrées (ou sa fonction et
+ses arguments) a changé depuis le dernier build, ou si une de ses sorties manque. Les cibles indépendantes
+tournent en parallèle dans un pool de processus.
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from utils.layout_snapshot import SNAPSHOT_INPUTS, snapshot_target_inputs
+
+PROCESSED = "services/data/processed"
+RAW = "services/data/raw"
+
+STATE_PATH = os.path.join(PROCESSED, ".build_state.json")
+
+# Cibles du build : fonction ("module:fonction"), arguments, entrées et sorties
+TARGETS = {
+    "planning_area": {
+        "func": "services.data.process_data:process_planning_area",
+        "inputs": [f"{RAW}/PlanningArea.geojson"],
+        "outputs": [f"{PROCESSED}/PlanningArea.geojson"],
+    },
+    "areazone": {
+        "func": "services.data.process_data_immo:process_planning_area",
+        "inputs": [f"{RAW}/areazone.geojson"],
+        "outputs": [f"{PROCESSED}/areazone.geojson"],
+    },
+    "cpi": {
+        "func": "services.data.process_economic_data:preprocess_CPI_data",
+        "inputs": [f"{RAW}/ConsumerPriceIndexCPI2019AsBaseYearMonthly.csv"],
+        "outputs": [f"{PROCESSED}/CPI_transformed.csv"],
+    },
+    "median_income": {
+        "func": "services.data.process_economic_data:transform_med_income",
+        "inputs": [f"{RAW}/MedianGrossMonthlyIncomeFromEmploymentofFullTimeEmployedResidentsTotal.csv"],
+        "outputs": [f"{PROCESSED}/median_income_transformed.csv"],
+    },
+    "partial_correlation": {
+        "func": "services.data.process_economic_data:save_partial_correlation",
+        "inputs": [f"{PROCESSED}/CPI_transformed.csv", f"{PROCESSED}/median_income_transformed.csv"],
+        "outputs": [f"{PROCESSED}/partial_correlation.npz"],
+    },
+    "salary_geojson": {
+        "func": "services.data.process_economic_data:prepare_planning_areas_geojson",
+        "inputs": [
+            f"{PROCESSED}/PlanningArea.geojson",
+            f"{RAW}/ResidentWorkingPersonsAged15YearsandOverbyPlanningAreaandGrossMonthlyIncomefromWorkGeneralHouseholdSurvey2015.csv",
+        ],
+        "outputs": [f"{PROCESSED}/PlanningAreaWithSalary.geojson"],
+    },
+    "course_data": {
+        "func": "services.data.process_education_data:preprocess_course_data",
+        "inputs": [f"{RAW}/IntakeEnrolmentGraduatesofUniversitiesbyCourse.csv"],
+        "outputs": [f"{PROCESSED}/course_data.csv"],
+    },
+    "annual_intake": {
+        "func": "services.data.process_education_data:calculate_annual_student_intake_and_enrolment",
+        "inputs": [f"{RAW}/IntakeEnrolmentandGraduatesofUniversitiesbyCourse.csv"],
+        "outputs": [f"{PROCESSED}/annual_student_intake_enrolment.csv"],
+    },
+    "annual_intake_pred": {
+        "func": "models.intake_enrolment_pred:intake_enrolment_pred",
+        "inputs": [f"{PROCESSED}/annual_student_intake_enrolment.csv"],
+        "outputs": [f"{PROCESSED}/updated_annual_student_intake_enrolment.csv"],
+    },
+    "institution_data": {
+        "func": "services.data.process_education_data:transform_institution_data",
+        "inputs": [f"{RAW}/Enrolment by Institutions.csv", f"{RAW}/Intake by Institutions.csv"],
+        "outputs": [f"{PROCESSED}/institution_data.csv"],
+    },
+    "immo": {
+        "func": "services.data.process_data_immo:process_data_immo",
+        "kwargs": {"save": True},
+        "inputs": [f"{RAW}/immo.csv"],
+        "outputs": [f"{PROCESSED}/immo.csv"],
+    },
+    "town_street_index": {
+        "func": "services.data.process_data_immo:build_town_street_index",
+        "inputs": [f"{PROCESSED}/immobilier.csv"],
+        "outputs": [f"{PROCESSED}/town_street_index.json"],
+    },
+    "price_geojson": {
+        "func": "services.data.process_data_immo:prepare_planning_areas_geojson",
+        "inputs": [
+            f"{PROCESSED}/PlanningArea.geojson",
+            f"{PROCESSED}/immo_map_price.csv",
+            f"{PROCESSED}/df_grouped_resale.csv",
+        ],
+        "outputs": [f"{PROCESSED}/PriceWithSalary.geojson"],
+    },
+    "price_salary_geojson": {
+        "func": "services.data.process_data_immo:merge_salary_data",
+        "inputs": [f"{PROCESSED}/PriceWithSalary.geojson", f"{PROCESSED}/PlanningAreaWithSalary.geojson"],
+        "outputs": [f"{PROCESSED}/PriceWithSalaryUpdated.geojson"],
+    },
+    "price_pred_snapshot": {
+        "func": "services.data.snapshots:snapshot_csv",
+        "kwargs": {"csv_path": f"{PROCESSED}/price_pred.csv"},
+        "inputs": [f"{PROCESSED}/price_pred.csv"],
+        "outputs": [f"{PROCESSED}/price_pred.feather"],
+    },
+    "price_history_geojson": {
+        "func": "services.data.process_data_immo:prepare_planning_areas_geojson_history",
+        "inputs": [
+            f"{PROCESSED}/PlanningArea.geojson",
+            f"{PROCESSED}/immo_map_price.csv",
+            f"{PROCESSED}/df_grouped_resale.csv",
+            f"{PROCESSED}/price_pred.csv",
+        ],
+        "outputs": [f"{PROCESSED}/PriceWithHistory.geojson"],
+    },
+    "planning_area_geometry": {
+        "func": "services.maps.geometry:build_simplified_geometries",
+        "kwargs": {"geojson_path": f"{PROCESSED}/PlanningArea.geojson", "properties": ["Name", "PLN_AREA_N"]},
+        "inputs": [f"{PROCESSED}/PlanningArea.geojson"],
+        "outputs": [f"{PROCESSED}/PlanningArea.{resolution}.geojson" for resolution in ("low", "medium", "high")],
+    },
+    "housing_geometry": {
+        "func": "services.maps.map_immo:build_map_geometries",
+        "inputs": [f"{PROCESSED}/PriceWithHistory.geojson"],
+        "outputs": [f"{PROCESSED}/PriceWithHistory.{resolution}.geojson" for resolution in ("low", "medium", "high")],
+    },
+    "map_price": {
+        "func": "services.build:save_folium_map",
+        "kwargs": {"builder": "figures.immobilier_fig:create_folium_map",
+                   "output_path": "services/maps/folium_map_price.html"},
+        "inputs": [f"{PROCESSED}/PriceWithSalaryUpdated.geojson"],
+        "outputs": ["services/maps/folium_map_price.html"],
+    },
+    "map_resale": {
+        "func": "services.build:save_folium_map",
+        "kwargs": {"builder": "figures.immobilier_fig:create_folium_map_resale",
+                   "output_path": "services/maps/folium_map_resale.html"},
+        "inputs": [f"{PROCESSED}/PriceWithSalaryUpdated.geojson"],
+        "outputs": ["services/maps/folium_map_resale.html"],
+    },
+    "map_salary": {
+        "func": "services.build:save_folium_map",
+        "kwargs": {"builder": "figures.economy:create_folium_map",
+                   "output_path": "services/maps/working_residents_salary_pop_map.html"},
+        "inputs": [f"{PROCESSED}/PlanningAreaWithSalary.geojson"],
+        "outputs": ["services/maps/working_residents_salary_pop_map.html"],
+    },
+    "static_maps": {
+        "func": "services.maps.static_maps:publish_maps",
+        "inputs": [
+            "services/maps/folium_map_resale.html",
+            "services/maps/folium_map_price.html",
+            "services/maps/working_residents_salary_pop_map.html",
+        ],
+        "outputs": ["services/maps/static/manifest.json"],
+    },
+}
+
+# Snapshots des layouts de pages : entrées = fichiers réellement lus par chaque page
+TARGETS["layout_snapshots"] = {
+    "func": "utils.layout_snapshot:build_layout_snapshots",
+    "inputs": snapshot_target_inputs() + ["pages/economy.py", "pages/education.py", "pages/immobilier.py"],
+    "outputs": [f"{PROCESSED}/layouts/{module}.json" for module in sorted(SNAPSHOT_INPUTS)],
+}
+
+
+def _resolve(ref):
+    module_name, func_name = ref.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def save_folium_map(builder, output_path):
+    """ Construit une carte Folium (builder = "module:fonction") et l'enregistre en HTML. """
+    _resolve(builder)().save(output_path)
+
+
+def run_target(name, target):
+    """ Exécute une cible (dans un processus du pool) et retourne sa durée. """
+    start = time.perf_counter()
+    _resolve(target["func"])(**target.get("kwargs", {}))
+    return time.perf_counter() - start
+
+
+def file_hash(path, files_state):
+    """
+    Hash sha256 du contenu d'un fichier.
+    Le hash est mémorisé avec (mtime, taille) pour ne pas relire les fichiers inchangés.
+    """
+    stat = os.stat(path)
+    cached = files_state.get(path)
+    if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+        return cached["sha256"]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    files_state[path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest.hexdigest()}
+    return digest.hexdigest()
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {"files": {}, "targets": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def target_dependencies(targets=TARGETS):
+    """ Retourne, pour chaque cible, l'ensemble des cibles qui produisent ses entrées. """
+    producers = {output: name for name, target in targets.items() for output in target["outputs"]}
+    return {
+        name: {producers[path] for path in target["inputs"] if path in producers} - {name}
+        for name, target in targets.items()
+    }
+
+
+def select_targets(names, targets=TARGETS):
+    """ Cibles demandées et toutes leurs dépendances (toutes les cibles si names est vide). """
+    if not names:
+        return set(targets)
+
+    unknown = set(names) - set(targets)
+    if unknown:
+        raise ValueError(f"Unknown targets: {sorted(unknown)}")
+
+    dependencies = target_dependencies(targets)
+    selected, pending = set(), list(names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(dependencies[name])
+    return selected
+
+
+def input_hashes(target, files_state):
+    """ Hash des entrées d'une cible, ou None si une entrée est absente. """
+    if not all(os.path.exists(path) for path in target["inputs"]):
+        return None
+    return {path: file_hash(path, files_state) for path in target["inputs"]}
+
+
+def target_recipe(target):
+    """ Fonction et arguments d'une cible : les modifier rend la cible périmée. """
+    return json.dumps([target["func"], target.get("kwargs", {})], sort_keys=True)
+
+
+def is_stale(name, target, hashes, state):
+    if not all(os.path.exists(path) for path in target["outputs"]):
+        return True
+    recorded = state["targets"].get(name, {})
+    return recorded.get("inputs") != hashes or recorded.get("recipe") != target_recipe(target)
+
+
+def build(names=None, force=False, jobs=None, dry_run=False, targets=TARGETS, state_path=STATE_PATH):
+    """
+    Reconstruit les cibles périmées (et leurs dépendances) en parallèle.
+
+    Retourne un dictionnaire nom de cible -> statut :
+    "built", "up-to-date", "stale" (dry_run), "missing-inputs: <fichiers>",
+    "skipped: <dépendance> <statut>" ou "failed: ...".
+    En dry_run, l'état du build (STATE_PATH) n'est pas écrit.
+    """
+    selected = select_targets(names, targets)
+    dependencies = {name: deps & selected for name, deps in target_dependencies(targets).items() if name in selected}
+    state = load_state(state_path)
+    results = {}
+    pending = set(selected)
+    running = {}
+
+    def usable(dep):
+        # Une dépendance sans entrées reste utilisable si ses sorties existent déjà
+        if results[dep].startswith("missing-inputs"):
+            return all(os.path.exists(path) for path in targets[dep]["outputs"])
+        return results[dep] in ("built", "up-to-date")
+
+    def schedule(executor):
+        progress = True
+        while progress:
+            progress = False
+            for name in sorted(pending):
+                deps = dependencies[name]
+                if any(dep not in results for dep in deps):
+                    continue
+                pending.discard(name)
+                progress = True
+
+                if dry_run and any(results[dep] == "stale" for dep in deps):
+                    results[name] = "stale"
+                    continue
+                blocking = sorted(dep for dep in deps if not usable(dep))
+                if blocking:
+                    # On indique la dépendance en cause et son propre statut
+                    results[name] = f"skipped: {blocking[0]} {results[blocking[0]]}"
+                    continue
+
+                target = targets[name]
+                hashes = input_hashes(target, state["files"])
+                if hashes is None:
+                    missing = [path for path in target["inputs"] if not os.path.exists(path)]
+                    results[name] = f"missing-inputs: {', '.join(missing)}"
+                elif not force and not is_stale(name, target, hashes, state):
+                    results[name] = "up-to-date"
+                elif dry_run:
+                    results[name] = "stale"
+                else:
+                    running[executor.submit(run_target, name, target)] = (name, hashes)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        schedule(executor)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, hashes = running.pop(future)
+                try:
+                    duration = future.result()
+                except Exception as exc:
+                    results[name] = f"failed: {exc!r}"
+                    continue
+                results[name] = "built"
+                state["targets"][name] = {
+                    "inputs": hashes,
+                    "recipe": target_recipe(targets[name]),
+                    "duration_s": round(duration, 3),
+                }
+                print(f"✅ {name} ({duration:.2f} s)")
+            save_state(state, state_path)
+            schedule(executor)
+
+    if not dry_run:
+        save_state(state, state_path)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build incrémental des données traitées.")
+    parser.add_argument("targets", nargs="*", help="Cibles à construire (toutes par défaut)")
+    parser.add_argument("-f", "--force", action="store_true", help="Reconstruire même si rien n'a changé")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Nombre de processus (défaut : nombre de CPU)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Afficher les cibles périmées sans les construire")
+    parser.add_argument("-l", "--list", action="store_true", help="Lister les cibles et leurs dépendances")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, deps in sorted(target_dependencies().items()):
+            print(f"{name}: {', '.join(sorted(deps)) or '-'}")
+        return 0
+
+    start = time.perf_counter()
+    results = build(args.targets, force=args.force, jobs=args.jobs, dry_run=args.dry_run)
+    for name in sorted(results):
+        print(f"{name:<24} {results[name]}")
+    print(f"Build terminé en {time.perf_counter() - start:.2f} s")
+    return int(any(status.startswith("failed") for status in results.values()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
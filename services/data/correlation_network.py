@@ -0,0 +1,124 @@
+import warnings
+
+import numpy as np
+from scipy.special import erfc
+from scipy.linalg import inv
+
+# Estimateurs de la matrice de précision et corrections de tests multiples disponibles
+PRECISION_METHODS = ("inverse", "ledoit_wolf", "graphical_lasso")
+CORRECTIONS = ("bonferroni", "bh")
+
+# Graphical lasso : pénalité et itérations avec lesquelles il converge sur les séries CPI / salaire
+# (environ 800 itérations ; avec alpha = 0.05, il lui en faut plus de 1300)
+GLASSO_ALPHA = 0.1
+GLASSO_MAX_ITER = 5000
+
+
+def estimate_precision(values, method="inverse", glasso_alpha=GLASSO_ALPHA, glasso_max_iter=GLASSO_MAX_ITER):
+    """
+    Estime la matrice de précision (inverse de la corrélation) de séries standardisées.
+
+    Paramètres :
+      - values : tableau (observations × variables), colonnes centrées-réduites.
+      - method : "inverse" (inverse exacte, comme historiquement), "ledoit_wolf"
+        (rétrécissement, stable quand les séries sont nombreuses ou colinéaires) ou
+        "graphical_lasso" (précision creuse, pénalité glasso_alpha).
+
+    Lève RuntimeError si le graphical lasso ne converge pas en glasso_max_iter
+    itérations : le réseau n'est pas construit à partir d'une estimation inachevée.
+    """
+    if method == "inverse":
+        return inv(np.corrcoef(values, rowvar=False))
+
+    # scikit-learn n'est importé que si un estimateur régularisé est demandé
+    if method == "ledoit_wolf":
+        from sklearn.covariance import LedoitWolf
+        return LedoitWolf(assume_centered=True).fit(values).precision_
+    if method == "graphical_lasso":
+        from sklearn.covariance import GraphicalLasso
+        from sklearn.exceptions import ConvergenceWarning
+
+        model = GraphicalLasso(alpha=glasso_alpha, assume_centered=True, max_iter=glasso_max_iter)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ConvergenceWarning)
+            try:
+                model.fit(values)
+            except ConvergenceWarning as warning:
+                raise RuntimeError(
+                    f"graphical_lasso did not converge (alpha={glasso_alpha}, max_iter={glasso_max_iter}): {warning}"
+                ) from None
+        return model.precision_
+
+    raise ValueError(f"Unknown precision method: {method!r} (expected one of {PRECISION_METHODS})")
+
+
+def partial_correlations(precision):
+    """ Corrélations partielles rho_ij = -theta_ij / sqrt(theta_ii * theta_jj), diagonale à 0. """
+    scale = np.sqrt(np.diag(precision))
+    corr_partial = -precision / np.outer(scale, scale)
+    np.fill_diagonal(corr_partial, 0.0)
+    return np.clip(corr_partial, -1.0, 1.0)
+
+
+def fisher_p_values(corr_partial, n_obs):
+    """ p-values bilatérales du test de Fisher sur chaque corrélation partielle (diagonale à 0). """
+    n_vars = corr_partial.shape[0]
+    dof = max(n_obs - n_vars, 1)
+
+    with np.errstate(divide="ignore"):
+        z_scores = np.arctanh(corr_partial) * np.sqrt(dof)
+    p_values = erfc(np.abs(z_scores) / np.sqrt(2))  # = 2 * norm.sf(|z|), sans importer scipy.stats
+    np.fill_diagonal(p_values, 0.0)
+    return p_values
+
+
+def adjust_p_values(p_values, correction="bonferroni"):
+    """
+    Corrige les p-values pour les n(n-1)/2 paires testées (triangle supérieur) :
+      - "bonferroni" : p × nombre de paires.
+      - "bh" : Benjamini-Hochberg (contrôle du taux de fausses découvertes).
+    Retourne une matrice symétrique de p-values ajustées (diagonale à 0) ;
+    une paire est significative au seuil alpha si sa p-value ajustée est < alpha.
+    """
+    n_vars = p_values.shape[0]
+    rows, cols = np.triu_indices(n_vars, k=1)
+    pairs = p_values[rows, cols]
+    n_pairs = pairs.size
+
+    if correction == "bonferroni":
+        adjusted = np.minimum(pairs * n_pairs, 1.0)
+    elif correction == "bh":
+        order = np.argsort(pairs)
+        ranked = pairs[order] * n_pairs / np.arange(1, n_pairs + 1)
+        # Minimum cumulé depuis la plus grande p-value pour garder la monotonie
+        ranked = np.minimum.accumulate(ranked[::-1])[::-1]
+        adjusted = np.empty_like(pairs)
+        adjusted[order] = np.minimum(ranked, 1.0)
+    else:
+        raise ValueError(f"Unknown correction: {correction!r} (expected one of {CORRECTIONS})")
+
+    matrix = np.zeros_like(p_values)
+    matrix[rows, cols] = adjusted
+    matrix[cols, rows] = adjusted
+    return matrix
+
+
+def estimate_network(df, method="inverse"):
+    """
+    Estime le réseau de corrélations partielles entre les colonnes de df.
+
+    Retourne un dictionnaire :
+      - var_names : noms des variables.
+      - corr_partial : matrice des corrélations partielles.
+      - p_values : p-values brutes (à corriger avec adjust_p_values).
+    """
+    df_std = (df - df.mean()) / df.std()
+    values = df_std.to_numpy(dtype=float)
+
+    corr_partial = partial_correlations(estimate_precision(values, method=method))
+
+    return {
+        "var_names": df.columns.tolist(),
+        "corr_partial": corr_partial,
+        "p_values": fisher_p_values(corr_partial, values.shape[0]),
+    }
@@ -0,0 +1,137 @@
+import hashlib
+import io
+import os
+from urllib.parse import urlencode
+
+from flask import Response, abort, request, send_file
+
+from services.data.dataset_query import get_dataset_view
+from utils.data_config import get_dataset_by_id
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow est optionnel : sans lui, l'export Parquet est désactivé
+    pa = None
+    pq = None
+
+EXPORT_URL_PREFIX = "/export"
+
+# Lignes sérialisées par morceau : borne la mémoire utilisée par une réponse
+EXPORT_CHUNK_ROWS = 5000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Paramètres de requête transmis au moteur de requêtes (services.data.dataset_query)
+QUERY_PARAMS = ("search", "filter_column", "filter_value", "sort_by")
+
+
+def export_url(dataset_id, fmt="csv", start=None, stop=None, **query):
+    """ URL d'export d'un jeu de données ; les paramètres vides sont omis. """
+    # Comparaisons explicites : 1 == True et 1.0 == True, un test "in (None, '', True)" les perdrait
+    params = {key: value for key, value in query.items()
+              if not (value is None or value == "" or value is True)}
+    if query.get("ascending") is False:
+        params["ascending"] = "0"
+    if start is not None:
+        params["start"] = start
+    if stop is not None:
+        params["stop"] = stop
+    url = f"{EXPORT_URL_PREFIX}/{dataset_id}.{fmt}"
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def _csv_chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0).encode("utf-8")
+    if len(df) == 0:
+        yield df.to_csv(index=False).encode("utf-8")
+
+
+def _jsonl_chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows].to_json(orient="records", lines=True, force_ascii=False)
+        yield (chunk if chunk.endswith("\n") else chunk + "\n").encode("utf-8")
+
+
+def _parquet_chunks(df, chunk_rows):
+    # Un row group par morceau : les octets écrits sont envoyés puis le tampon est vidé
+    buffer = io.BytesIO()
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(buffer, schema) as writer:
+        for start in range(0, len(df), chunk_rows):
+            writer.write_table(pa.Table.from_pandas(df.iloc[start:start + chunk_rows], schema=schema, preserve_index=False))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+CHUNK_WRITERS = {"csv": _csv_chunks, "jsonl": _jsonl_chunks, "parquet": _parquet_chunks}
+
+
+def _row_bound(name):
+    value = request.args.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        abort(400, f"{name} must be a non-negative integer")
+
+
+def _export_etag(csv_path, fmt, args):
+    stat = os.stat(csv_path)
+    key = f"{os.path.abspath(csv_path)}:{stat.st_mtime_ns}:{stat.st_size}:{fmt}:{sorted(args.items())}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def register_dataset_export(server, url_prefix=EXPORT_URL_PREFIX, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Ajoute au serveur Flask la route d'export des jeux de données du catalogue :
+    {url_prefix}/<id>.<csv|jsonl|parquet>?search=&filter_column=&filter_value=&sort_by=&ascending=&start=&stop=
+
+      - sans paramètre, le CSV source est envoyé tel quel (send_file : Range, ETag, 304) ;
+      - sinon, la vue filtrée / triée est découpée en [start, stop) et envoyée par
+        morceaux de chunk_rows lignes, avec un ETag dérivé du fichier et de la requête.
+        Ce flux n'a pas de longueur connue d'avance : les requêtes Range (octets) n'y sont
+        pas prises en charge (Accept-Ranges: none) ; start / stop servent à reprendre un
+        export par lignes.
+    """
+
+    @server.route(f"{url_prefix}/<dataset_id>.<fmt>", endpoint="dataset_export")
+    def export_dataset(dataset_id, fmt):
+        dataset = get_dataset_by_id(dataset_id)
+        if dataset is None or not os.path.exists(dataset["csv_path"]):
+            abort(404)
+        if fmt not in EXPORT_FORMATS or (fmt == "parquet" and pq is None):
+            abort(404)
+
+        filename = f"{dataset_id}.{fmt}"
+        csv_path = dataset["csv_path"]
+
+        if fmt == "csv" and not request.args:
+            return send_file(csv_path, mimetype=EXPORT_FORMATS[fmt], as_attachment=True,
+                             download_name=filename, conditional=True)
+
+        etag = _export_etag(csv_path, fmt, request.args.to_dict())
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        query = {name: request.args.get(name) or None for name in QUERY_PARAMS}
+        view = get_dataset_view(csv_path, ascending=request.args.get("ascending", "1") != "0", **query)
+        view = view.iloc[_row_bound("start"):_row_bound("stop")]
+
+        response = Response(CHUNK_WRITERS[fmt](view, chunk_rows), mimetype=EXPORT_FORMATS[fmt])
+        response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response.headers["Accept-Ranges"] = "none"
+        response.set_etag(etag)
+        return response
+
+    return export_dataset
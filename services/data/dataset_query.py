@@ -0,0 +1,102 @@
+import math
+import os
+
+import pandas as pd
+
+from services.data.dataset_registry import read_dataset
+from utils.cache import TTLCache
+from utils.config import DATA_QUERY_CACHE_SIZE
+
+# Séparateur des colonnes dans le texte de recherche (absent des données)
+_SEARCH_SEPARATOR = "\x1f"
+
+# Vues filtrées / triées, indexées par (fichier, version, paramètres de requête)
+_views = TTLCache(maxsize=DATA_QUERY_CACHE_SIZE)
+# Texte de recherche (toutes colonnes, en minuscules) par version de fichier
+_search_text = TTLCache(maxsize=DATA_QUERY_CACHE_SIZE)
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _get_search_text(df, signature):
+    text = _search_text.get(signature)
+    if text is None:
+        columns = [df[col].astype(str) for col in df.columns]
+        text = columns[0].str.cat(columns[1:], sep=_SEARCH_SEPARATOR).str.lower()
+        _search_text.set(signature, text)
+    return text
+
+
+def _build_view(df, signature, search, filter_column, filter_value, sort_by, ascending):
+    mask = pd.Series(True, index=df.index)
+
+    if search:
+        text = _get_search_text(df, signature)
+        mask &= text.str.contains(search.lower(), regex=False)
+
+    if filter_column in df.columns and filter_value not in (None, ""):
+        values = df[filter_column].astype(str).str.lower()
+        mask &= values.str.contains(str(filter_value).lower(), regex=False)
+
+    view = df[mask] if not mask.all() else df
+    if sort_by in view.columns:
+        # Tri stable : l'ordre du fichier est conservé entre valeurs égales
+        view = view.sort_values(sort_by, ascending=ascending, kind="mergesort", na_position="last")
+    return view
+
+
+def get_dataset_view(csv_path, search=None, filter_column=None, filter_value=None, sort_by=None, ascending=True):
+    """
+    DataFrame filtré et trié d'un jeu de données, mis en cache par combinaison de paramètres.
+
+    Le fichier est lu une fois par worker (registre partagé, snapshot typé si disponible) ;
+    la vue est recalculée seulement quand le fichier ou la requête change, pas à chaque page.
+    """
+    signature = _file_signature(csv_path)
+    key = (signature, search or "", filter_column, filter_value or "", sort_by, bool(ascending))
+
+    view = _views.get(key)
+    if view is None:
+        df = read_dataset(csv_path)
+        view = _build_view(df, signature, search, filter_column, filter_value, sort_by, ascending)
+        _views.set(key, view)
+    return view
+
+
+def _to_rows(df):
+    # Les valeurs manquantes sont envoyées vides plutôt qu'en NaN (non sérialisable en JSON)
+    return df.astype(object).where(df.notna(), None).values.tolist()
+
+
+def query_dataset(csv_path, page=1, page_size=10, **query):
+    """
+    Retourne une page d'un jeu de données, après filtrage, recherche et tri.
+
+    Paramètres :
+      - page : numéro de page (à partir de 1, ramené dans les bornes).
+      - page_size : nombre de lignes par page.
+      - query : search, filter_column, filter_value, sort_by, ascending (voir get_dataset_view).
+    Seules les lignes de la page sont converties en listes Python.
+    """
+    view = get_dataset_view(csv_path, **query)
+
+    total_rows = len(view)
+    total_pages = max(1, math.ceil(total_rows / page_size))
+    page = min(max(1, page or 1), total_pages)
+    start = (page - 1) * page_size
+
+    return {
+        "columns": list(view.columns),
+        "rows": _to_rows(view.iloc[start:start + page_size]),
+        "page": page,
+        "total_pages": total_pages,
+        "total_rows": total_rows,
+    }
+
+
+def clear_query_cache():
+    _views.clear()
+    _search_text.clear()
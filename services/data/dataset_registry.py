@@ -0,0 +1,154 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from services.data.snapshots import fresh_snapshot, read_snapshot
+
+
+# Budget mémoire par défaut du registre (par worker)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class DatasetRegistry:
+    """
+    Registre des DataFrames chargés depuis le disque, partagé par tout le processus.
+
+    Chaque fichier est lu une seule fois par worker puis servi depuis la mémoire.
+    La clé de cache contient le chemin absolu, le mtime et la taille du fichier :
+    si le fichier est régénéré, la prochaine lecture recharge automatiquement la
+    nouvelle version. Au-delà de `max_bytes`, les jeux de données les moins
+    récemment utilisés sont évincés (LRU).
+
+    Les appelants reçoivent une vue superficielle (`copy(deep=False)`) : ils
+    peuvent ajouter, renommer ou remplacer des colonnes sans toucher à l'entrée
+    en cache. Les tableaux numpy de l'entrée sont en lecture seule : une
+    modification en place (`.loc[...] = ...`) lève une ValueError au lieu de
+    corrompre le cache ; il faut alors travailler sur `df.copy()`.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _file_signature(path):
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _freeze_values(df):
+        # Les vues superficielles remises aux appelants partagent ces tableaux. Le DataFrame
+        # est reconstruit à partir de vues en lecture seule de chaque colonne (sans copie) :
+        # geler seulement la vue d'une colonne ne protège pas le bloc que pandas modifie.
+        columns = {}
+        for position, dtype in enumerate(df.dtypes):
+            column = df.iloc[:, position]
+            values = column.to_numpy(copy=False) if isinstance(dtype, np.dtype) else column.array
+            if isinstance(values, np.ndarray):
+                values.setflags(write=False)
+            columns[position] = values
+
+        frozen = pd.DataFrame(columns, index=df.index, copy=False)
+        frozen.columns = df.columns
+        return frozen
+
+    @staticmethod
+    def _freeze_kwargs(kwargs):
+        frozen = []
+        for key, value in sorted(kwargs.items()):
+            if isinstance(value, (list, set, tuple)):
+                value = tuple(value)
+            elif isinstance(value, dict):
+                value = tuple(sorted(value.items()))
+            frozen.append((key, value))
+        return tuple(frozen)
+
+    def get(self, path, loader=pd.read_csv, **read_kwargs):
+        """
+        Retourne le DataFrame associé à `path`, en le chargeant avec `loader` si besoin.
+
+        Paramètres :
+          - path : chemin du fichier à lire.
+          - loader : fonction de lecture (par défaut pd.read_csv).
+          - read_kwargs : arguments transmis au loader (font partie de la clé de cache).
+        """
+        abs_path, mtime_ns, size = self._file_signature(path)
+        key = (abs_path, getattr(loader, "__qualname__", repr(loader)), self._freeze_kwargs(read_kwargs))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == (mtime_ns, size):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry["df"].copy(deep=False)
+
+        # Lecture hors du verrou pour ne pas bloquer les autres jeux de données
+        df = loader(path, **read_kwargs)
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        df = self._freeze_values(df)
+
+        with self._lock:
+            self.misses += 1
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous["nbytes"]
+            self._entries[key] = {"df": df, "signature": (mtime_ns, size), "nbytes": nbytes}
+            self._current_bytes += nbytes
+            self._evict()
+
+        return df.copy(deep=False)
+
+    def _evict(self):
+        # On garde toujours au moins l'entrée la plus récente, même si elle dépasse le budget
+        while self._current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self._current_bytes -= entry["nbytes"]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def info(self):
+        """ Retourne les statistiques du registre (taille, budget, hits/misses). """
+        with self._lock:
+            return {
+                "datasets": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Instance unique partagée par tous les loaders de services/data
+registry = DatasetRegistry()
+
+
+def read_dataset(path, **read_kwargs):
+    """
+    Lit un CSV via le registre partagé (chargé une fois par worker).
+
+    Si un snapshot colonnaire à jour existe à côté du CSV, il est lu à la place
+    (memory mapping, types déclarés). Le CSV reste la source de repli.
+    """
+    if not read_kwargs:
+        snapshot = fresh_snapshot(path)
+        if snapshot is not None:
+            return registry.get(snapshot, loader=read_snapshot)
+    return registry.get(path, **read_kwargs)
+
+
+def clear_dataset_cache():
+    registry.clear()
+
+
+def get_dataset_cache_info():
+    return registry.info()
@@ -0,0 +1,63 @@
+import shapely
+from shapely.geometry import shape
+
+
+def normalize_area_key(name):
+    """ Clé de jointure d'une planning area : nom sans espaces superflus, en majuscules. """
+    return str(name or "").strip().upper()
+
+
+def table_lookup(df, key_col, value_cols, converters=None):
+    """
+    Construit un dictionnaire clé normalisée -> {colonne: valeur} à partir d'un DataFrame.
+    En cas de doublon, la première ligne est gardée.
+    converters : fonctions de conversion optionnelles par colonne (ex. {"working_population": int}).
+    """
+    converters = converters or {}
+    df = df.assign(_key=df[key_col].map(normalize_area_key)).drop_duplicates("_key")
+
+    lookup = {}
+    for record in df[["_key", *value_cols]].to_dict(orient="records"):
+        key = record.pop("_key")
+        lookup[key] = {col: converters.get(col, lambda v: v)(value) for col, value in record.items()}
+    return lookup
+
+
+def feature_lookup(geojson, properties, key="PLN_AREA_N"):
+    """ Dictionnaire clé normalisée -> propriétés choisies, à partir d'un autre GeoJSON. """
+    return {
+        normalize_area_key(feature["properties"].get(key)): {
+            name: feature["properties"].get(name) for name in properties
+        }
+        for feature in geojson["features"]
+    }
+
+
+def enrich_features(geojson, lookups, key="PLN_AREA_N", defaults=None):
+    """
+    Ajoute aux propriétés de chaque feature les valeurs trouvées dans chaque lookup
+    (jointure par dictionnaire sur la clé normalisée, O(features + lignes)).
+    defaults : valeurs utilisées quand une feature n'a pas de correspondance.
+    """
+    defaults = defaults or {}
+    for feature in geojson["features"]:
+        props = feature["properties"]
+        area_key = normalize_area_key(props.get(key))
+        for lookup in lookups:
+            props.update(lookup.get(area_key, {}))
+        for name, value in defaults.items():
+            props.setdefault(name, value)
+    return geojson
+
+
+def add_centroids(geojson):
+    """ Ajoute le centroïde {"lat", "lng"} des features qui n'en ont pas, en un seul appel vectorisé. """
+    missing = [feature for feature in geojson["features"] if "centroid" not in feature["properties"]]
+    if not missing:
+        return geojson
+
+    centroids = shapely.centroid([shape(feature["geometry"]) for feature in missing])
+    for feature, x, y in zip(missing, shapely.get_x(centroids), shapely.get_y(centroids)):
+        feature["properties"]["centroid"] = {"lat": float(y), "lng": float(x)}
+    return geojson
+
@@ -0,0 +1,115 @@
+import gzip
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : repli sur le module json standard
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack est optionnel : nécessaire seulement pour l'encodage binaire
+    msgpack = None
+
+# Nombre de décimales gardées pour les coordonnées (6 décimales ≈ 0,1 m)
+DEFAULT_PRECISION = 6
+
+MSGPACK_EXTENSION = ".msgpack"
+
+
+def round_coordinates(coordinates, precision=DEFAULT_PRECISION):
+    """ Arrondit récursivement un tableau de coordonnées GeoJSON (et retire l'altitude). """
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        return [round(value, precision) for value in coordinates[:2]]
+    return [round_coordinates(part, precision) for part in coordinates]
+
+
+def _compact_geometry(geometry, precision):
+    if precision is None or geometry is None:
+        return geometry
+    if geometry["type"] == "GeometryCollection":
+        return {"type": "GeometryCollection",
+                "geometries": [_compact_geometry(g, precision) for g in geometry["geometries"]]}
+    return {"type": geometry["type"], "coordinates": round_coordinates(geometry["coordinates"], precision)}
+
+
+def _compact_feature(feature, precision):
+    compact = dict(feature)
+    compact["geometry"] = _compact_geometry(feature.get("geometry"), precision)
+    return compact
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _open_output(path, compress):
+    if compress == "gzip" or (compress is None and path.endswith(".gz")):
+        return gzip.open(path, "wb", compresslevel=6)
+    return open(path, "wb")
+
+
+def _open_input(path):
+    with open(path, "rb") as f:
+        is_gzip = f.read(2) == b"\x1f\x8b"
+    return gzip.open(path, "rb") if is_gzip else open(path, "rb")
+
+
+def write_geojson(geojson, output_path, precision=DEFAULT_PRECISION, compress=None):
+    """
+    Écrit une FeatureCollection feature par feature, sans indentation.
+
+    Paramètres :
+      - precision : décimales gardées pour les coordonnées (None pour ne pas arrondir).
+      - compress : "gzip" (implicite si le chemin finit par .gz) ou None.
+    Si le chemin finit par .msgpack, le fichier est encodé en MessagePack.
+    """
+    if output_path.removesuffix(".gz").endswith(MSGPACK_EXTENSION):
+        return _write_msgpack(geojson, output_path, precision, compress)
+
+    header = {key: value for key, value in geojson.items() if key != "features"}
+    with _open_output(output_path, compress) as f:
+        # En-tête de la collection, puis les features une à une
+        f.write(_dumps(header)[:-1])
+        f.write(b',"features":[' if header else b'"features":[')
+        for i, feature in enumerate(geojson["features"]):
+            if i:
+                f.write(b",")
+            f.write(_dumps(_compact_feature(feature, precision)))
+        f.write(b"]}")
+
+
+def _write_msgpack(geojson, output_path, precision, compress):
+    if msgpack is None:
+        raise ImportError("msgpack is required to write MessagePack GeoJSON")
+
+    packer = msgpack.Packer()
+    header = {key: value for key, value in geojson.items() if key != "features"}
+    with _open_output(output_path, compress) as f:
+        f.write(packer.pack_map_header(len(header) + 1))
+        for key, value in header.items():
+            f.write(packer.pack(key))
+            f.write(packer.pack(value))
+        f.write(packer.pack("features"))
+        f.write(packer.pack_array_header(len(geojson["features"])))
+        for feature in geojson["features"]:
+            f.write(packer.pack(_compact_feature(feature, precision)))
+
+
+def read_geojson(path):
+    """
+    Lit un GeoJSON écrit par write_geojson (ou tout fichier JSON) : détecte gzip,
+    décode le MessagePack selon l'extension et utilise orjson s'il est installé.
+    """
+    with _open_input(path) as f:
+        data = f.read()
+
+    if path.removesuffix(".gz").endswith(MSGPACK_EXTENSION):
+        if msgpack is None:
+            raise ImportError("msgpack is required to read MessagePack GeoJSON")
+        return msgpack.unpackb(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,4 +1,4 @@
-import json
+from services.data.geojson_io import read_geojson, write_geojson
 import re
 import os
 from shapely.geometry import shape, mapping
@@ -17,8 +17,7 @@ def process_planning_area():
         return "Unknown"
 
     # 📌 Charger le GeoJSON brut
-    with open(RAW_GEOJSON_PATH, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
+    raw_data = read_geojson(RAW_GEOJSON_PATH)
 
     # 📌 Nettoyer et simplifier les données
     for feature in raw_data["features"]:
@@ -27,8 +26,7 @@ def process_planning_area():
 
     # 📌 Sauvegarder le GeoJSON optimisé
     os.makedirs(os.path.dirname(PROCESSED_GEOJSON_PATH), exist_ok=True)
-    with open(PROCESSED_GEOJSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(raw_data, f, indent=4)
+    write_geojson(raw_data, PROCESSED_GEOJSON_PATH)
 
     print(f"✅ Fichier simplifié et sauvegardé dans {PROCESSED_GEOJSON_PATH}")
 
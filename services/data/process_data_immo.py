@@ -3,17 +3,26 @@ import branca
 import json
 import re
 import os
-from shapely.geometry import shape
+from bisect import bisect_left
+from functools import lru_cache
+
+from services.data.dataset_registry import read_dataset
+from services.data.geojson_enrichment import (
+    normalize_area_key, table_lookup, feature_lookup, enrich_features, add_centroids,
+)
+from services.data.geojson_io import read_geojson, write_geojson
+from services.data.snapshots import save_processed
 
 
 # from process_economic_data import prepare_planning_areas_geojson
 
-def process_data_immo():
+def process_data_immo(save=False):
     #chemin des fichiers
     RAW_DATA_PATH = "services/data/raw/immo.csv"
+    PROCESSED_DATA_PATH = "services/data/processed/immo.csv"
 
     #charger le fichier
-    df = pd.read_csv(RAW_DATA_PATH)
+    df = read_dataset(RAW_DATA_PATH)
 
     df["price_m2"] = df["resale_price"] / df["floor_area_sqm"]
 
@@ -28,17 +37,15 @@ def process_data_immo():
 
     df_grouped["price_m2"] = df_grouped["price_m2"].round(2)
 
-    return df_grouped[["Date", "price_m2"]].to_dict(orient="records")
-
-    # # Sauvegarder le fichier
-    # PROCESSED_DATA_PATH = "services/data/processed/immo.csv"
-
-    # df_grouped.to_csv(PROCESSED_DATA_PATH, index=False)
+    # Sauvegarder le fichier (CSV + snapshot colonnaire) lors du prétraitement hors ligne
+    if save:
+        save_processed(df_grouped, PROCESSED_DATA_PATH)
+        print(f"✅ Fichier traité et sauvegardé dans {PROCESSED_DATA_PATH}")
 
-    # print(f"✅ Fichier traité et sauvegardé dans {PROCESSED_DATA_PATH}")
+    return df_grouped[["Date", "price_m2"]].to_dict(orient="records")
 
 # if __name__ == "__main__":
-#     process_data_immo()
+#     process_data_immo(save=True)
 
 
 def process_data_table_intro():
@@ -46,7 +53,7 @@ def process_data_table_intro():
     RAW_DATA_PATH = "services/data/raw/immo.csv"
 
     #charger le fichier
-    df = pd.read_csv(RAW_DATA_PATH)
+    df = read_dataset(RAW_DATA_PATH)
 
     # Convertir 'Month' en datetime et extraire l'année
     df['month'] = pd.to_datetime(df['month'])
@@ -60,7 +67,7 @@ def process_data_table_intro():
     return df_scd_graph
 
 def process_data_map_income():
-    df_income = pd.read_csv("services/data/raw/income.csv")
+    df_income = read_dataset("services/data/raw/income.csv")
     df_income = df_income.drop(columns=['Total'])
     income_cols = df_income.columns[1:]  # Supposons que la première colonne est 'Planning Area'
 
@@ -134,8 +141,7 @@ def process_planning_area():
         return "Unknown"
 
     # 📌 Charger le GeoJSON brut
-    with open(RAW_GEOJSON_PATH, "r", encoding="utf-8") as f:
-        areazone_data = json.load(f)
+    areazone_data = read_geojson(RAW_GEOJSON_PATH)
 
     # 📌 Nettoyer et simplifier les données
     for feature in areazone_data["features"]:
@@ -144,8 +150,7 @@ def process_planning_area():
 
     # 📌 Sauvegarder le GeoJSON optimisé
     os.makedirs(os.path.dirname(PROCESSED_GEOJSON_PATH), exist_ok=True)
-    with open(PROCESSED_GEOJSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(areazone_data, f, indent=4)
+    write_geojson(areazone_data, PROCESSED_GEOJSON_PATH)
 
     print(f"✅ Fichier simplifié et sauvegardé dans {PROCESSED_GEOJSON_PATH}")
 
@@ -179,42 +184,23 @@ def prepare_planning_areas_geojson(geojson_path="services/data/processed/Plannin
     # Charger le CSV des prix au m²
     df_price = pd.read_csv("services/data/processed/immo_map_price.csv")
     df_price = df_price[df_price["Year"] == 2017]  # Filtrer pour l'année 2017
-    df_price["town"] = df_price["town"].str.strip().str.upper()  # Normaliser les noms
 
     # Charger le CSV des prix de revente
     df_resale = pd.read_csv("services/data/processed/df_grouped_resale.csv")
     df_resale = df_resale[df_resale["Year"] == 2017]  # Filtrer pour l'année 2017
-    df_resale["town"] = df_resale["town"].str.strip().str.upper()  # Normaliser les noms
 
     # Charger le GeoJSON
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        geojson = json.load(f)
-
-    # Mettre à jour les propriétés des features selon la planning area
-    for feature in geojson["features"]:
-        area_name = feature["properties"].get("PLN_AREA_N", "").strip().upper()
-
-        # Ajouter price_m2
-        row_price = df_price[df_price["town"] == area_name]
-        if not row_price.empty:
-            feature["properties"]["price_m2"] = float(row_price.iloc[0]["price_m2"])
-
-        # Ajouter resale_price
-        row_resale = df_resale[df_resale["town"] == area_name]
-        if not row_resale.empty:
-            feature["properties"]["resale_price"] = float(row_resale.iloc[0]["resale_price"])
-
-    # Ajouter le centroïde pour chaque zone si non présent
-    for feature in geojson["features"]:
-        if "centroid" not in feature["properties"]:
-            geom = feature["geometry"]
-            poly = shape(geom)
-            centroid = poly.centroid
-            feature["properties"]["centroid"] = {"lat": centroid.y, "lng": centroid.x}
+    geojson = read_geojson(geojson_path)
+
+    # Jointure par clé normalisée puis centroïdes en un seul appel
+    enrich_features(geojson, [
+        table_lookup(df_price, "town", ["price_m2"], converters={"price_m2": float}),
+        table_lookup(df_resale, "town", ["resale_price"], converters={"resale_price": float}),
+    ])
+    add_centroids(geojson)
 
     # Sauvegarder le GeoJSON enrichi
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geojson, f, indent=4)
+    write_geojson(geojson, output_path)
 
     return geojson
 
@@ -227,34 +213,19 @@ def merge_salary_data(price_geojson_path="services/data/processed/PriceWithSalar
     """
     
     # Charger le GeoJSON des salaires
-    with open(salary_geojson_path, "r", encoding="utf-8") as f:
-        salary_geojson = json.load(f)
-
-    # Construire un dictionnaire pour un accès rapide aux données de salaire
-    salary_data = {}
-    for feature in salary_geojson["features"]:
-        area_name = feature["properties"].get("PLN_AREA_N", "").strip().upper()
-        salary_data[area_name] = {
-            "working_population": feature["properties"].get("working_population"),
-            "median_salary_category": feature["properties"].get("median_salary_category"),
-        }
+    salary_geojson = read_geojson(salary_geojson_path)
+
+    # Dictionnaire pour un accès rapide aux données de salaire
+    salary_data = feature_lookup(salary_geojson, ["working_population", "median_salary_category"])
 
     # Charger le GeoJSON des prix
-    with open(price_geojson_path, "r", encoding="utf-8") as f:
-        price_geojson = json.load(f)
+    price_geojson = read_geojson(price_geojson_path)
 
     # Mettre à jour les propriétés des features du GeoJSON des prix
-    for feature in price_geojson["features"]:
-        area_name = feature["properties"].get("PLN_AREA_N", "").strip().upper()
-        
-        # Vérifier si on a les données de salaire correspondantes
-        if area_name in salary_data:
-            feature["properties"]["working_population"] = salary_data[area_name]["working_population"]
-            feature["properties"]["median_salary_category"] = salary_data[area_name]["median_salary_category"]
+    enrich_features(price_geojson, [salary_data])
 
     # Sauvegarder le GeoJSON mis à jour
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(price_geojson, f, indent=4)
+    write_geojson(price_geojson, output_path)
 
     return price_geojson
 
@@ -276,49 +247,35 @@ def prepare_planning_areas_geojson_history(geojson_path="services/data/processed
     df_resale = pd.read_csv("services/data/processed/df_grouped_resale.csv")
     df_history = pd.read_csv("services/data/processed/price_pred.csv")  # Historique des prix
 
-    # Filtrer pour 2017 et normaliser les noms de quartiers
+    # Filtrer pour 2017
     df_price = df_price[df_price["Year"] == 2017]
     df_resale = df_resale[df_resale["Year"] == 2017]
-    df_price["town"] = df_price["town"].str.strip().str.upper()
-    df_resale["town"] = df_resale["town"].str.strip().str.upper()
 
     # Construire l'historique des prix par quartier (matrice)
-    df_history["town"] = df_history["town"].str.strip().str.upper()
-    price_history_dict = df_history.groupby("town").apply(
-        lambda g: g[["Year", "Month", "price_m2"]].sort_values(["Year", "Month"]).to_dict(orient="records")
-    ).to_dict()
+    df_history["town"] = df_history["town"].map(normalize_area_key)
+    df_history = df_history.sort_values(["town", "Year", "Month"])
+    price_history = {
+        town: {"price_m2_history": group[["Year", "Month", "price_m2"]].to_dict(orient="records")}
+        for town, group in df_history.groupby("town", sort=False)
+    }
 
     # Charger le GeoJSON
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        geojson = json.load(f)
-
-    # Ajouter les informations aux features
-    for feature in geojson["features"]:
-        area_name = feature["properties"].get("PLN_AREA_N", "").strip().upper()
-
-        # Prix au m² (2017)
-        row_price = df_price[df_price["town"] == area_name]
-        if not row_price.empty:
-            feature["properties"]["price_m2"] = float(row_price.iloc[0]["price_m2"])
-
-        # Prix de revente (2017)
-        row_resale = df_resale[df_resale["town"] == area_name]
-        if not row_resale.empty:
-            feature["properties"]["resale_price"] = float(row_resale.iloc[0]["resale_price"])
-
-        # Historique des prix au m² (matrice)
-        feature["properties"]["price_m2_history"] = price_history_dict.get(area_name, [])
-
-        # Ajouter le centroïde si absent
-        if "centroid" not in feature["properties"]:
-            geom = feature["geometry"]
-            poly = shape(geom)
-            centroid = poly.centroid
-            feature["properties"]["centroid"] = {"lat": centroid.y, "lng": centroid.x}
+    geojson = read_geojson(geojson_path)
+
+    # Ajouter les informations aux features (jointures par clé normalisée)
+    enrich_features(
+        geojson,
+        [
+            table_lookup(df_price, "town", ["price_m2"], converters={"price_m2": float}),
+            table_lookup(df_resale, "town", ["resale_price"], converters={"resale_price": float}),
+            price_history,
+        ],
+        defaults={"price_m2_history": []},
+    )
+    add_centroids(geojson)
 
     # Sauvegarder le GeoJSON enrichi
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geojson, f, indent=4)
+    write_geojson(geojson, output_path)
 
     return geojson
 
@@ -333,9 +290,9 @@ if __name__ == "__main__":
 # if __name__ == "__main__":
 #     prepare_planning_areas_geojson()
 
-def process_data_line_history():
+def process_data_line_history(csv_path="services/data/processed/price_pred.csv"):
 
-    df = pd.read_csv("services/data/processed/price_pred.csv")
+    df = read_dataset(csv_path)
 
     df["town"] = df["town"].replace("Kallang/Whampoa", "Kallang")
 
@@ -347,15 +304,121 @@ def process_data_line_history():
 
     return df
 
-def process_town_street():
-    df = pd.read_csv("services/data/processed/immobilier.csv")
 
-    town_street_dict = {}
+def get_town_price_store(csv_path="services/data/processed/price_pred.csv"):
+    """
+    Retourne les agrégats de prix par quartier, calculés une seule fois par version du fichier.
+
+    Retourne un dictionnaire :
+      - history : dict town -> DataFrame (Date, price_m2) trié par date.
+      - towns : tableau numpy des quartiers (ordre alphabétique).
+      - means_2024 : tableau numpy du prix moyen au m² en 2024, aligné sur towns.
+    """
+    stat = os.stat(csv_path)
+    return _build_town_price_store(csv_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=2)
+def _build_town_price_store(csv_path, mtime_ns, size):
+    # mtime_ns et size ne servent qu'à invalider le cache quand le fichier change
+    df = process_data_line_history(csv_path).sort_values(["Year", "Month"])
+
+    history = {
+        town: group[["Date", "price_m2"]].reset_index(drop=True)
+        for town, group in df.groupby("town", sort=False)
+    }
+
+    means_2024 = df[df["Year"] == 2024].groupby("town")["price_m2"].mean()
+
+    return {
+        "history": history,
+        "towns": means_2024.index.to_numpy(),
+        "means_2024": means_2024.to_numpy(),
+    }
+
+
+TOWN_STREET_CSV_PATH = "services/data/processed/immobilier.csv"
+TOWN_STREET_INDEX_PATH = "services/data/processed/town_street_index.json"
 
-    for town, street in df[["town", "street_name"]].drop_duplicates().values:
-        if town not in town_street_dict:
-            town_street_dict[town] = []
-        if street not in town_street_dict[town]:
-            town_street_dict[town].append(street)
 
-    return town_street_dict
\ No newline at end of file
+def process_town_street(csv_path=TOWN_STREET_CSV_PATH):
+    """ Retourne un dictionnaire town -> liste triée et dédoublonnée des rues. """
+    df = read_dataset(csv_path, usecols=["town", "street_name"]).dropna()
+
+    return {
+        town: sorted(streets.unique().tolist())
+        for town, streets in df.groupby("town", sort=True)["street_name"]
+    }
+
+
+def build_town_street_index(csv_path=TOWN_STREET_CSV_PATH, index_path=TOWN_STREET_INDEX_PATH):
+    """ Écrit l'index town -> rues dans un JSON compact, chargé ensuite par get_town_street_index. """
+    index = process_town_street(csv_path)
+
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+
+    return index
+
+
+def get_town_street_index(index_path=TOWN_STREET_INDEX_PATH, csv_path=TOWN_STREET_CSV_PATH):
+    """
+    Retourne l'index town -> rues triées, chargé une seule fois par version des fichiers.
+    L'index JSON n'est utilisé que s'il n'est pas plus ancien que le CSV ; sinon
+    (index absent ou périmé), il est calculé depuis le CSV.
+    """
+    return _get_town_street_data(index_path, csv_path)[0]
+
+
+def _get_town_street_data(index_path, csv_path):
+    csv_stat = os.stat(csv_path)
+    try:
+        index_stat = os.stat(index_path)
+        index_signature = (index_stat.st_mtime_ns, index_stat.st_size)
+    except FileNotFoundError:
+        index_signature = None
+    return _load_town_street_index(index_path, csv_path, (csv_stat.st_mtime_ns, csv_stat.st_size), index_signature)
+
+
+@lru_cache(maxsize=2)
+def _load_town_street_index(index_path, csv_path, csv_signature, index_signature):
+    # Les signatures (mtime_ns, size) du CSV et de l'index ne servent qu'à invalider le cache
+    if index_signature is not None and index_signature[0] >= csv_signature[0]:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+    else:
+        index = process_town_street(csv_path)
+
+    # Tuples : l'index est partagé entre les callbacks et ne doit pas être modifié.
+    # Clés de recherche en casefold, triées, alignées sur les rues qu'elles désignent.
+    streets = {}
+    search_keys = {}
+    for town, names in index.items():
+        ordered = sorted(names, key=str.casefold)
+        streets[town] = tuple(names)
+        search_keys[town] = (tuple(name.casefold() for name in ordered), tuple(ordered))
+    return streets, search_keys
+
+
+def get_town_streets(town):
+    """ Retourne les rues d'un quartier (tuple trié, vide si le quartier est inconnu). """
+    return get_town_street_index().get(town, ())
+
+
+def search_streets(town, prefix="", limit=None):
+    """
+    Recherche par préfixe (insensible à la casse : casefold du préfixe et des rues)
+    dans les rues d'un quartier. Les clés étant triées, la recherche se fait par dichotomie.
+    """
+    keys, streets = _get_town_street_data(TOWN_STREET_INDEX_PATH, TOWN_STREET_CSV_PATH)[1].get(town, ((), ()))
+    prefix = (prefix or "").casefold()
+    if not prefix:
+        return list(streets[:limit])
+
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + "\U0010ffff", lo=start)
+    return list(streets[start:end if limit is None else min(end, start + limit)])
+
+
+# if __name__ == "__main__":
+#     build_town_street_index()
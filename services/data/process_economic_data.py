@@ -1,24 +1,27 @@
 import pandas as pd
 import numpy as np
-import json
-import scipy.stats
-from shapely.geometry import shape
-from scipy.linalg import inv
-from itertools import combinations
+import os
+from functools import lru_cache
+
+from services.data.correlation_network import estimate_network, adjust_p_values
+from services.data.dataset_registry import read_dataset
+from services.data.geojson_enrichment import table_lookup, enrich_features, add_centroids
+from services.data.geojson_io import read_geojson, write_geojson
+from services.data.snapshots import save_processed
 
 
 def get_unemployment_by_city(csv_path="services/data/raw/UnemploymentRate.csv"):
     """
     Récupère le taux de chômage par ville.
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     return df
 
 def get_overall_unemployment_rate(csv_path="services/data/raw/OverallUnemploymentRateAnnual.csv"):
     """
     Récupère et formate le taux de chômage de Singapour au fil des ans.
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     df = df[df["residential_status"] == "overall"]  # Filtrer pour ne garder que les valeurs globales
     df = df[["year", "unemployment_rate"]].dropna()  # Garder uniquement les colonnes nécessaires
     df["year"] = df["year"].astype(str)  # Convertir l'année en chaîne pour l'affichage
@@ -33,7 +36,7 @@ def get_unemployment_by_age(csv_path="services/data/raw/unemployment_by_age.csv"
       - Colonnes: year, age, unemployment_rate
     Retourne une liste de dictionnaires avec pour chaque année, une clé pour chaque tranche d'âge.
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     # Pivot : chaque ligne correspond à une année, et les colonnes aux tranches d'âge.
     pivot = df.pivot(index="year", columns="age", values="unemployment_rate").reset_index()
     return pivot.to_dict(orient="records")
@@ -46,7 +49,7 @@ def get_unemployment_by_qualification(csv_path="services/data/raw/unemployment_b
       - Colonnes: year, highest_qualification_attained, unemployment_rate
     Retourne une liste de dictionnaires avec pour chaque année, une clé pour chaque niveau de qualification.
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     pivot = df.pivot(index="year", columns="highest_qualification_attained", values="unemployment_rate").reset_index()
     return pivot.to_dict(orient="records")
 
@@ -58,7 +61,7 @@ def get_unemployment_by_sex(csv_path="services/data/raw/unemployment_by_sex.csv"
       - Colonnes: year, sex, unemployment_rate
     Retourne une liste de dictionnaires avec pour chaque année, des colonnes 'Male' et 'Female'.
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     pivot = df.pivot(index="year", columns="sex", values="unemployment_rate").reset_index()
     pivot = pivot.rename(columns={"male": "Male", "female": "Female"})
     return pivot.to_dict(orient="records")
@@ -79,8 +82,8 @@ def get_combined_cpi_salary_data(cpi_csv="services/data/processed/CPI_transforme
         et pour chaque catégorie du CPI ainsi que la colonne "Median Salary Index" (l'ancienne "index").
     """
     # Charger les données CPI
-    df_cpi = pd.read_csv(cpi_csv)
-    df_salary = pd.read_csv(salary_csv)[["year_month", "index"]]    
+    df_cpi = read_dataset(cpi_csv)
+    df_salary = read_dataset(salary_csv)[["year_month", "index"]]    
     df_cpi = pd.merge(df_cpi, df_salary, on="year_month", how="inner")
     # on renomme la colonne index en Median Salary Index
     df_cpi.rename(columns={"index": "Median Salary Index"}, inplace=True)
@@ -111,7 +114,7 @@ def get_cpi_multiselect(cpi_csv="services/data/processed/CPI_transformed.csv", s
       - options : liste d'options pour un composant dmc.Select ou dmc.MultiSelect.
     """
     # Lire le fichier CSV transformé
-    df_cpi = pd.read_csv(cpi_csv)
+    df_cpi = read_dataset(cpi_csv)
     
     # Nettoyer les noms de colonnes (supprimer les espaces superflus)
     df_cpi.columns = df_cpi.columns.str.strip()
@@ -240,30 +243,19 @@ def prepare_planning_areas_geojson(geojson_path="services/data/processed/Plannin
     On utilisera la colonne "Total" pour la population et la dernière colonne pour la catégorie de salaire.
     """
     df = preprocess_salary_data(csv_path)
-    
 
     df["PlanningArea"] = df.iloc[:,0].str.strip()
     df[background_variable] = pd.to_numeric(df.iloc[:,1], errors="coerce")
-    
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        geojson = json.load(f)
-    
-    for feature in geojson["features"]:
-        area_name = feature["properties"].get("PLN_AREA_N", "").strip()
-        row = df[df["PlanningArea"].str.upper() == area_name.upper()]
-        if not row.empty:
-            feature["properties"][background_variable] = int(row.iloc[0][background_variable])
-            feature["properties"]["median_salary_category"] = row.iloc[0]["median_salary_category"]
 
-    for feature in geojson["features"]:
-        if "centroid" not in feature["properties"]:
-            geom = feature["geometry"]
-            poly = shape(geom)
-            centroid = poly.centroid
-            feature["properties"]["centroid"] = {"lat": centroid.y, "lng": centroid.x}
+    geojson = read_geojson(geojson_path)
+
+    # Jointure par clé normalisée puis centroïdes en un seul appel
+    salary_lookup = table_lookup(df, "PlanningArea", [background_variable, "median_salary_category"],
+                                 converters={background_variable: int})
+    enrich_features(geojson, [salary_lookup])
+    add_centroids(geojson)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geojson, f, indent=4)
+    write_geojson(geojson, output_path)
 
     return geojson
 
@@ -284,7 +276,7 @@ def preprocess_CPI_data(csv_path="services/data/raw/ConsumerPriceIndexCPI2019AsB
 
     pivot_df = pivot_df[['year_month', 'All Items', 'Food', 'Clothing & Footwear', 'Housing & Utilities', 'Household Durables & Services', 'Health Care', 'Transport', 'Communication', 'Recreation & Culture', 'Education', 'Personal Care', 'Alcoholic Drinks & Tobacco', 'Public Transport']]
     
-    pivot_df.to_csv("services/data/processed/CPI_transformed.csv", index=False)
+    save_processed(pivot_df, "services/data/processed/CPI_transformed.csv")
     
     print("Transformation terminée. Le fichier 'CPI_transformed.csv' a été enregistré.")
     return pivot_df
@@ -330,49 +322,89 @@ def transform_med_income(csv_path="services/data/raw/MedianGrossMonthlyIncomeFro
     
     df_monthly = df_monthly[['year', 'month', 'year_month', 'med_income_incl_empcpf', 'index']]
     
-    df_monthly.to_csv(output_csv, index=False)
+    save_processed(df_monthly, output_csv)
     
     return df_monthly
 
 
-def compute_partial_correlation_matrix(alpha=0.05):
+CPI_TRANSFORMED_CSV = "services/data/processed/CPI_transformed.csv"
+MEDIAN_INCOME_CSV = "services/data/processed/median_income_transformed.csv"
+PARTIAL_CORRELATION_PATH = "services/data/processed/partial_correlation.npz"
+
+
+def _compute_partial_correlation(cpi_csv=CPI_TRANSFORMED_CSV, salary_csv=MEDIAN_INCOME_CSV, method="inverse"):
     """
-    Calcule la matrice des corrélations partielles et la matrice d'adjacence après correction de Bonferroni.
-    Retourne :
-    - adj_matrix : matrice binaire des liens significatifs.
-    - corr_matrix : matrice des corrélations partielles.
-    - var_names : noms des variables (pour les nœuds du graphe).
+    Calcule les corrélations partielles et leurs p-values (test de Fisher) entre
+    les composantes du CPI et l'indice du salaire médian.
+    Ces résultats ne dépendent pas de alpha.
     """
-    df_cpi = pd.read_csv("services/data/processed/CPI_transformed.csv").drop(columns=["All Items"])
-    df_salary = pd.read_csv("services/data/processed/median_income_transformed.csv")[["year_month", "index"]]
-    df_salary.rename(columns={"index": "Median Salary Index"}, inplace=True)
+    df_cpi = read_dataset(cpi_csv).drop(columns=["All Items"])
+    df_salary = read_dataset(salary_csv)[["year_month", "index"]]
+    df_salary = df_salary.rename(columns={"index": "Median Salary Index"})
 
     df = pd.merge(df_cpi, df_salary, on="year_month", how="inner").drop(columns=["year_month"])
 
-    df_std = (df - df.mean()) / df.std()
+    return estimate_network(df, method=method)
 
-    precision_matrix = inv(df_std.corr().values)  
-    n_vars = df_std.shape[1]
-    corr_partial = np.zeros((n_vars, n_vars))
-    p_values = np.zeros((n_vars, n_vars))
 
-    for i, j in combinations(range(n_vars), 2):
-        theta_ij = precision_matrix[i, j]
-        theta_ii = precision_matrix[i, i]
-        theta_jj = precision_matrix[j, j]
-        corr_partial[i, j] = -theta_ij / np.sqrt(theta_ii * theta_jj)
-        corr_partial[j, i] = corr_partial[i, j]
+def save_partial_correlation(output_path=PARTIAL_CORRELATION_PATH):
+    """ Écrit les corrélations partielles et p-values précalculées (cible du build). """
+    result = _compute_partial_correlation()
+    np.savez(output_path, var_names=np.array(result["var_names"]),
+             corr_partial=result["corr_partial"], p_values=result["p_values"])
 
-        dof = df_std.shape[0] - n_vars
-        z_score = 0.5 * np.log((1 + corr_partial[i, j]) / (1 - corr_partial[i, j])) * np.sqrt(dof)
-        p_values[i, j] = 2 * (1 - scipy.stats.norm.cdf(np.abs(z_score)))
-        p_values[j, i] = p_values[i, j]
 
-    alpha_corr = alpha / (n_vars * (n_vars - 1) / 2)
-    adj_matrix = (p_values < alpha_corr).astype(int)
-
-    return adj_matrix, corr_partial, df.columns.tolist()
+def get_partial_correlation(method="inverse", correction="bonferroni"):
+    """
+    Retourne les corrélations partielles et p-values (brutes et corrigées), calculées
+    une seule fois par version des fichiers CPI / salaire et par méthode.
+    Le fichier précalculé par le build (méthode "inverse") est utilisé s'il est
+    plus récent que les deux CSV.
+    """
+    signature = tuple((os.stat(path).st_mtime_ns, os.stat(path).st_size)
+                      for path in (CPI_TRANSFORMED_CSV, MEDIAN_INCOME_CSV))
+    return _load_partial_correlation(signature, method, correction)
+
+
+@lru_cache(maxsize=8)
+def _load_partial_correlation(signature, method, correction):
+    # signature (mtime_ns, size des deux CSV) ne sert qu'à invalider le cache
+    newest_input = max(mtime_ns for mtime_ns, _ in signature)
+    if (method == "inverse" and os.path.exists(PARTIAL_CORRELATION_PATH)
+            and os.stat(PARTIAL_CORRELATION_PATH).st_mtime_ns >= newest_input):
+        with np.load(PARTIAL_CORRELATION_PATH) as cached:
+            result = {
+                "var_names": cached["var_names"].tolist(),
+                "corr_partial": cached["corr_partial"],
+                "p_values": cached["p_values"],
+            }
+    else:
+        result = _compute_partial_correlation(method=method)
+
+    result["adjusted_p_values"] = adjust_p_values(result["p_values"], correction)
+
+    # Les tableaux sont partagés entre les callbacks : lecture seule
+    for key in ("corr_partial", "p_values", "adjusted_p_values"):
+        result[key].setflags(write=False)
+    return result
+
+
+def compute_partial_correlation_matrix(alpha=0.05, method="inverse", correction="bonferroni"):
+    """
+    Calcule la matrice des corrélations partielles et la matrice d'adjacence après
+    correction des tests multiples (Bonferroni par défaut, ou "bh" pour Benjamini-Hochberg).
+    Seul le seuillage des p-values corrigées (précalculées) dépend de alpha.
+    method : "inverse", "ledoit_wolf" ou "graphical_lasso" (voir correlation_network).
+    Retourne :
+    - adj_matrix : matrice binaire des liens significatifs.
+    - corr_matrix : matrice des corrélations partielles.
+    - var_names : noms des variables (pour les nœuds du graphe).
+    """
+    result = get_partial_correlation(method, correction)
+    adj_matrix = (result["adjusted_p_values"] < alpha).astype(int)
+    np.fill_diagonal(adj_matrix, 1)
 
+    return adj_matrix, result["corr_partial"], list(result["var_names"])
 
 
 if __name__ == "__main__":
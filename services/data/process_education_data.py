@@ -2,6 +2,9 @@ import pandas as pd
 import numpy as np
 import warnings
 
+from services.data.dataset_registry import read_dataset
+from services.data.snapshots import save_processed
+
 ## Get data functions for the education data
 
 def get_aggregated_data(detail_level="global", parent_value=None, year=2022, csv_path="services/data/raw/GraduateEmploymentSurvey.csv"):
@@ -21,7 +24,7 @@ def get_aggregated_data(detail_level="global", parent_value=None, year=2022, csv
       basic_monthly_mean, basic_monthly_median, gross_monthly_mean, gross_monthly_median,
       gross_mthly_25_percentile, gross_mthly_75_percentile
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     
     # Conversion des colonnes numériques
     df["gross_monthly_median"] = pd.to_numeric(df["gross_monthly_median"], errors="coerce")
@@ -90,7 +93,7 @@ def get_line_chart_data(metric="intake_rate", gender="both", csv_path="services/
         raise ValueError(f"Le paramètre 'gender' doit être l'une des valeurs suivantes : {allowed_genders}")
     
     # Charger le CSV
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
         
     
     # Sélection de la colonne à utiliser
@@ -118,7 +121,7 @@ def get_line_chart_data(metric="intake_rate", gender="both", csv_path="services/
 
 
 def get_admission_trade_data(csv_path="services/data/processed/updated_annual_student_intake_enrolment.csv"):
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     df["year"] = pd.to_numeric(df["year"], errors="coerce")
     df["intake"] = pd.to_numeric(df["intake"], errors="coerce")
     df["enrolment"] = pd.to_numeric(df["enrolment"], errors="coerce")
@@ -142,7 +145,7 @@ def get_institution_trends_data(metric="enrolment", institutions=None, csv_path=
       Un DataFrame agrégé avec pour chaque (year, institution) la moyenne (ou valeur unique) de la métrique.
     """
     # Charger le CSV
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     
     # Conversion des colonnes numériques
     df["year"] = pd.to_numeric(df["year"], errors="coerce")
@@ -222,7 +225,7 @@ def preprocess_course_data(csv_path="services/data/raw/IntakeEnrolmentGraduateso
     )
 
     # On save les donnes dans services/data/processed pour une utilisation future
-    df_pivot.to_csv("services/data/processed/course_data.csv", index=False)
+    save_processed(df_pivot, "services/data/processed/course_data.csv")
     # Remarque : selon vos données, il faudra peut-être ajuster la logique si certaines valeurs sont manquantes.
     return df_pivot
 
@@ -308,7 +311,7 @@ def transform_institution_data(enrolment_csv="services/data/raw/Enrolment by Ins
     )
     
     # Enregistrer le résultat dans un fichier CSV
-    df_merged.to_csv(output_csv, index=False)
+    save_processed(df_merged, output_csv)
     return df_merged
 
 
@@ -318,8 +321,8 @@ def compute_corr_institution():
     """
     warnings.simplefilter(action="ignore", category=FutureWarning)
 
-    df_intake = pd.read_csv("services/data/raw/Intake by Institutions.csv")
-    df_enrolment = pd.read_csv("services/data/raw/Enrolment by Institutions.csv")
+    df_intake = read_dataset("services/data/raw/Intake by Institutions.csv")
+    df_enrolment = read_dataset("services/data/raw/Enrolment by Institutions.csv")
 
     # On filtre la colonne sex = "MF" et on drop la colonne sex
     df_intake = df_intake[df_intake["sex"] == "MF"].drop(columns=["sex"])
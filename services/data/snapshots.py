@@ -0,0 +1,141 @@
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow absent : on reste sur les CSV
+    pa = None
+    feather = None
+
+
+SNAPSHOT_EXTENSION = ".feather"
+
+# Types déclarés pour chaque fichier de services/data/processed.
+# Les colonnes non listées gardent le type inféré par pandas. Les effectifs sont
+# entiers : "Int64" (entier nullable) lorsque la colonne peut contenir des manquants.
+SNAPSHOT_SCHEMAS = {
+    "CPI_transformed.csv": {
+        "year_month": "str",
+        "All Items": "float64",
+        "Food": "float64",
+        "Clothing & Footwear": "float64",
+        "Housing & Utilities": "float64",
+        "Household Durables & Services": "float64",
+        "Health Care": "float64",
+        "Transport": "float64",
+        "Communication": "float64",
+        "Recreation & Culture": "float64",
+        "Education": "float64",
+        "Personal Care": "float64",
+        "Alcoholic Drinks & Tobacco": "float64",
+        "Public Transport": "float64",
+    },
+    "median_income_transformed.csv": {
+        "year": "int64",
+        "month": "str",
+        "year_month": "str",
+        "med_income_incl_empcpf": "float64",
+        "index": "float64",
+    },
+    "course_data.csv": {
+        "year": "int64",
+        "course": "str",
+        "enrolment_F": "int64",
+        "enrolment_MF": "int64",
+        "graduates_F": "int64",
+        "graduates_MF": "int64",
+        "intake_F": "Int64",
+        "intake_MF": "Int64",
+        "intake_rate_F": "float64",
+        "intake_rate_MF": "float64",
+        "intake_men": "Int64",
+        "enrolment_men": "int64",
+        "graduates_men": "int64",
+        "intake_rate_men": "float64",
+    },
+    "institution_data.csv": {
+        "year": "int64",
+        "institution": "str",
+        "enrolment": "float64",
+        "intake": "float64",
+        "intake_rate": "float64",
+    },
+    "immo.csv": {
+        "Year": "int64",
+        "Month": "int64",
+        "price_m2": "float64",
+        "Date": "str",
+    },
+    "price_pred.csv": {
+        "Year": "int64",
+        "Month": "int64",
+        "town": "str",
+        "price_m2": "float64",
+    },
+}
+
+
+def snapshot_path(csv_path):
+    """ Chemin du snapshot colonnaire associé à un CSV (même dossier, extension .feather). """
+    return os.path.splitext(csv_path)[0] + SNAPSHOT_EXTENSION
+
+
+def apply_schema(df, csv_path):
+    """ Convertit les colonnes de df selon le schéma déclaré pour ce fichier. """
+    schema = SNAPSHOT_SCHEMAS.get(os.path.basename(csv_path), {})
+    dtypes = {col: dtype for col, dtype in schema.items() if col in df.columns}
+    return df.astype(dtypes) if dtypes else df
+
+
+def write_snapshot(df, csv_path):
+    """
+    Écrit le snapshot Feather (Arrow IPC, non compressé) à côté du CSV.
+
+    Le fichier n'est pas compressé pour pouvoir être lu par memory mapping.
+    Retourne le chemin écrit, ou None si pyarrow n'est pas installé.
+    """
+    if feather is None:
+        return None
+
+    path = snapshot_path(csv_path)
+    table = pa.Table.from_pandas(apply_schema(df, csv_path), preserve_index=False)
+    feather.write_feather(table, path, compression="uncompressed")
+    return path
+
+
+def snapshot_csv(csv_path):
+    """
+    Écrit le snapshot d'un CSV traité produit hors des fonctions de prétraitement
+    (price_pred.csv, issu du modèle de prédiction des prix). Cible du build.
+    """
+    return write_snapshot(pd.read_csv(csv_path), csv_path)
+
+
+def read_snapshot(path):
+    """ Lit un snapshot Feather via memory mapping. """
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+
+def fresh_snapshot(csv_path):
+    """
+    Retourne le chemin du snapshot s'il existe et n'est pas plus ancien que le CSV.
+    Retourne None sinon (on retombe alors sur la lecture CSV).
+    """
+    if feather is None:
+        return None
+
+    path = snapshot_path(csv_path)
+    if not os.path.exists(path):
+        return None
+    if os.path.exists(csv_path) and os.stat(path).st_mtime_ns < os.stat(csv_path).st_mtime_ns:
+        return None
+    return path
+
+
+def save_processed(df, csv_path):
+    """ Écrit le CSV traité puis son snapshot colonnaire typé. """
+    df.to_csv(csv_path, index=False)
+    write_snapshot(df, csv_path)
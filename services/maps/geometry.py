@@ -0,0 +1,95 @@
+import os
+
+import shapely
+from shapely.geometry import shape, mapping
+
+from services.data.geojson_io import read_geojson, write_geojson
+
+# Résolutions générées (tolérance de simplification en degrés, ~1° = 111 km à Singapour)
+# et niveau de zoom Leaflet à partir duquel chacune est utilisée
+RESOLUTIONS = {
+    "low": {"tolerance": 0.001, "min_zoom": 0},
+    "medium": {"tolerance": 0.0002, "min_zoom": 12},
+    "high": {"tolerance": 0.00005, "min_zoom": 14},
+}
+
+# Grille de quantification des coordonnées (1e-5° ≈ 1 m)
+GRID_SIZE = 1e-5
+
+
+def simplify_geometries(geometries, tolerance, grid_size=GRID_SIZE):
+    """
+    Simplifie un ensemble de polygones adjacents sans créer de trous entre eux.
+
+    coverage_simplify (shapely >= 2.1) simplifie les frontières communes une seule
+    fois pour les deux polygones ; à défaut, chaque polygone est simplifié en
+    préservant sa topologie. Les coordonnées sont ensuite arrondies sur la grille.
+    """
+    # Accrochage préalable à la grille : retire les anneaux dégénérés que l'arrondi
+    # des fichiers compacts (services.data.geojson_io) peut laisser
+    geometries = shapely.set_precision(shapely.force_2d(geometries), grid_size)
+
+    if hasattr(shapely, "coverage_simplify"):
+        simplified = shapely.coverage_simplify(geometries, tolerance)
+    else:
+        simplified = shapely.simplify(geometries, tolerance, preserve_topology=True)
+
+    return shapely.set_precision(simplified, grid_size)
+
+
+def simplify_geojson(geojson, tolerance, grid_size=GRID_SIZE, properties=None):
+    """
+    Retourne une copie simplifiée d'une FeatureCollection.
+    properties : liste des propriétés à conserver (toutes par défaut).
+    """
+    features = geojson["features"]
+    geometries = simplify_geometries(
+        [shape(feature["geometry"]) for feature in features], tolerance, grid_size
+    )
+
+    simplified = []
+    for feature, geometry in zip(features, geometries):
+        props = feature["properties"]
+        if properties is not None:
+            props = {key: props[key] for key in properties if key in props}
+        simplified.append({"type": "Feature", "properties": props, "geometry": mapping(geometry)})
+
+    return {"type": "FeatureCollection", "features": simplified}
+
+
+def simplified_path(geojson_path, resolution):
+    """ Chemin de la version simplifiée d'un GeoJSON (ex. PlanningArea.medium.geojson). """
+    root, ext = os.path.splitext(geojson_path)
+    return f"{root}.{resolution}{ext}"
+
+
+def build_simplified_geometries(geojson_path, resolutions=RESOLUTIONS, grid_size=GRID_SIZE, properties=None):
+    """
+    Écrit une version simplifiée du GeoJSON pour chaque résolution, à côté du fichier source.
+    Retourne le dictionnaire résolution -> chemin écrit.
+    """
+    geojson = read_geojson(geojson_path)
+
+    written = {}
+    for resolution, params in resolutions.items():
+        output_path = simplified_path(geojson_path, resolution)
+        simplified = simplify_geojson(geojson, params["tolerance"], grid_size, properties)
+        # Coordonnées déjà quantifiées par set_precision : pas d'arrondi supplémentaire
+        write_geojson(simplified, output_path, precision=None)
+        written[resolution] = output_path
+
+    return written
+
+
+def resolution_for_zoom(zoom, resolutions=RESOLUTIONS):
+    """ Résolution la plus fine dont le zoom minimal est atteint. """
+    eligible = [name for name, params in resolutions.items() if (zoom or 0) >= params["min_zoom"]]
+    return max(eligible, key=lambda name: resolutions[name]["min_zoom"])
+
+
+def load_geometry(geojson_path, resolution="medium"):
+    """ Charge la version simplifiée demandée, ou le GeoJSON complet si elle n'a pas été générée. """
+    path = simplified_path(geojson_path, resolution)
+    if not os.path.exists(path):
+        path = geojson_path
+    return read_geojson(path)
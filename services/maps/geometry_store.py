@@ -0,0 +1,122 @@
+import os
+import threading
+
+from services.data.geojson_io import read_geojson
+from services.maps.geometry import simplified_path
+
+
+class GeometryStore:
+    """
+    Magasin géométrie / attributs d'un GeoJSON de planning areas.
+
+    Le fichier est lu une seule fois par version (mtime, taille). Les géométries,
+    les attributs légers et les attributs lourds (ex. historique des prix) sont
+    rangés séparément, indexés par la propriété clé (PLN_AREA_N) :
+      - feature_collection ne renvoie que les propriétés demandées, avec la
+        géométrie complète ou une version simplifiée (voir services.maps.geometry) ;
+      - les attributs lourds ne sont servis qu'à la demande, pour un quartier.
+    """
+
+    def __init__(self, path, key="PLN_AREA_N", heavy_properties=("price_m2_history",)):
+        self.path = path
+        self.key = key
+        self.heavy_properties = tuple(heavy_properties)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._keys = []
+        self._attributes = {}
+        self._heavy = {}
+        self._geometries = {}
+
+    def _ensure_loaded(self):
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return
+
+        with self._lock:
+            if signature == self._signature:
+                return
+            geojson = read_geojson(self.path)
+
+            keys, attributes, heavy, geometries = [], {}, {}, {}
+            for feature in geojson["features"]:
+                props = feature["properties"]
+                key = props.get(self.key, "").strip()
+                keys.append(key)
+                attributes[key] = {k: v for k, v in props.items() if k not in self.heavy_properties}
+                heavy[key] = {k: props[k] for k in self.heavy_properties if k in props}
+                geometries[key] = feature["geometry"]
+
+            self._keys, self._attributes, self._heavy = keys, attributes, heavy
+            # Les versions simplifiées sont rechargées à la demande
+            self._geometries = {None: geometries}
+            self._signature = signature
+
+    def _geometries_for(self, resolution):
+        self._ensure_loaded()
+        if resolution in self._geometries:
+            return self._geometries[resolution]
+
+        path = simplified_path(self.path, resolution)
+        if not os.path.exists(path):
+            # Version simplifiée pas encore générée (python -m services.build) : géométrie complète
+            return self._geometries[None]
+
+        simplified = read_geojson(path)
+        geometries = {
+            feature["properties"].get(self.key, "").strip(): feature["geometry"]
+            for feature in simplified["features"]
+        }
+        with self._lock:
+            self._geometries[resolution] = geometries
+        return geometries
+
+    def keys(self):
+        """ Clés (noms de planning areas) dans l'ordre du fichier. """
+        self._ensure_loaded()
+        return list(self._keys)
+
+    def feature_collection(self, properties=None, resolution=None, keys=None):
+        """
+        Construit une FeatureCollection.
+
+        Paramètres :
+          - properties : propriétés à inclure (tous les attributs légers par défaut).
+          - resolution : "low", "medium", "high" ou None pour la géométrie complète.
+          - keys : planning areas à inclure (toutes par défaut).
+        """
+        geometries = self._geometries_for(resolution)
+        selected = set(keys) if keys is not None else None
+
+        features = []
+        for key in self._keys:
+            if selected is not None and key not in selected:
+                continue
+            attributes = self._attributes[key]
+            if properties is not None:
+                attributes = {name: attributes[name] for name in properties if name in attributes}
+            features.append({
+                "type": "Feature",
+                "properties": dict(attributes),
+                "geometry": geometries.get(key, self._geometries[None][key]),
+            })
+
+        return {"type": "FeatureCollection", "features": features}
+
+    def heavy_attribute(self, key, name):
+        """ Attribut lourd (ex. price_m2_history) d'une seule planning area, ou None. """
+        self._ensure_loaded()
+        return self._heavy.get(key.strip(), {}).get(name)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_geometry_store(path, **kwargs):
+    """ Retourne le GeometryStore partagé pour ce fichier (un par processus). """
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = GeometryStore(path, **kwargs)
+        return _stores[path]
@@ -1,38 +1,55 @@
-import json
 import dash_leaflet as dl
+from dash import dcc, html
 
+from services.maps.geometry import build_simplified_geometries, resolution_for_zoom
+from services.maps.geometry_store import get_geometry_store
 from utils.config import TOWNS
 
-with open("services/data/processed/PriceWithHistory.geojson", "r") as f:
-    areazone_data = json.load(f)
+HOUSING_GEOJSON_PATH = "services/data/processed/PriceWithHistory.geojson"
 
+# Propriétés envoyées à la carte ; l'historique des prix n'y est pas (les graphiques du
+# quartier cliqué le lisent dans price_pred.csv, via get_town_price_store)
+MAP_PROPERTIES = ["Name", "PLN_AREA_N", "price_m2", "resale_price", "centroid"]
+
+INITIAL_ZOOM = 11
+
+
+def build_map_geometries():
+    """ Génère les géométries simplifiées (une par résolution) de la carte (cible du build). """
+    # Seule la clé est conservée : les attributs sont joints par le GeometryStore
+    return build_simplified_geometries(HOUSING_GEOJSON_PATH, properties=["PLN_AREA_N"])
+
+
+def get_map_geojson(resolution):
+    """ GeoJSON des quartiers affichés, à la résolution demandée (seulement les propriétés de MAP_PROPERTIES). """
+    return get_geometry_store(HOUSING_GEOJSON_PATH).feature_collection(
+        properties=MAP_PROPERTIES,
+        resolution=resolution,
+        keys=[town["value"].strip() for town in TOWNS],
+    )
 
-def filter_geojson_by_towns(geojson, towns):
-    allowed = {town["value"].strip() for town in towns}
-    filtered_features = [
-        feature for feature in geojson["features"]
-        if feature["properties"].get("PLN_AREA_N", "").strip() in allowed
-    ]
-    geojson["features"] = filtered_features
-    return geojson
 
 def create_map():
-    with open("services/data/processed/PriceWithHistory.geojson", "r", encoding="utf-8") as f:
-        geojson = json.load(f)
-    
-    geojson_filtered = filter_geojson_by_towns(geojson, TOWNS)
-    
-    return dl.Map(
-        center=[1.3521, 103.8198],
-        zoom=11,
-        children=[
-            dl.TileLayer(),
-            dl.GeoJSON(
-                data=geojson_filtered,
-                id="geojson-layer",
-                style={"color": "blue", "weight": 2, "fillOpacity": 0.1},
-                hoverStyle={"color": "red", "weight": 3},
-                interactive=True,
+    resolution = resolution_for_zoom(INITIAL_ZOOM)
+
+    return html.Div(
+        [
+            dcc.Store(id="geojson-resolution", data=resolution),
+            dl.Map(
+                id="housing-map",
+                center=[1.3521, 103.8198],
+                zoom=INITIAL_ZOOM,
+                children=[
+                    dl.TileLayer(),
+                    dl.GeoJSON(
+                        data=get_map_geojson(resolution),
+                        id="geojson-layer",
+                        style={"color": "blue", "weight": 2, "fillOpacity": 0.1},
+                        hoverStyle={"color": "red", "weight": 3},
+                        interactive=True,
+                    ),
+                ],
+                style={"height": "100%", "width": "100%"},
             ),
         ],
         style={"height": "100%", "width": "100%"},
@@ -1,12 +1,12 @@
-import json
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from services.data.geojson_io import read_geojson
+
 # 📌 Charger et traiter les données GeoJSON
 def load_and_process_geojson(geojson_path="services/data/processed/PlanningArea.geojson"):
-    with open(geojson_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_geojson(geojson_path)
 
     # 📌 Extraire les noms des Planning Areas
     planning_areas = []
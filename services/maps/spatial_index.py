@@ -0,0 +1,133 @@
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from services.data.geojson_io import read_geojson
+
+PLANNING_AREA_GEOJSON = "services/data/processed/PlanningArea.geojson"
+SUBZONE_GEOJSON = "services/data/raw/areasubzone.geojson"
+
+
+def _description_attribute(description, name):
+    # Les GeoJSON issus du KML de data.gov.sg rangent leurs attributs dans une table HTML
+    match = re.search(rf"<th>{name}<\/th> <td>(.*?)<\/td>", description or "")
+    if not match:
+        return None
+    return " ".join(word.capitalize() for word in match.group(1).split())
+
+
+class SpatialIndex:
+    """
+    Index spatial (STRtree) sur des polygones nommés, pour rattacher des points
+    ou des emprises à une planning area / subzone.
+
+    Les requêtes sont vectorisées : un appel traite un lot entier de coordonnées
+    (longitude, latitude) via les prédicats shapely 2 sur géométries préparées.
+    """
+
+    def __init__(self, geometries, names):
+        self.geometries = np.asarray(geometries, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        shapely.prepare(self.geometries)
+        self.tree = shapely.STRtree(self.geometries)
+
+    @classmethod
+    def from_geojson(cls, geojson_path, key="PLN_AREA_N"):
+        """
+        Construit l'index depuis un GeoJSON. Le nom de chaque polygone est lu dans
+        la propriété key, ou à défaut dans la table HTML "Description" du KML.
+        """
+        geojson = read_geojson(geojson_path)
+
+        geometries, names = [], []
+        for feature in geojson["features"]:
+            props = feature["properties"]
+            name = props.get(key) or _description_attribute(props.get("Description"), key)
+            geometries.append(shape(feature["geometry"]))
+            names.append(name)
+
+        return cls(shapely.force_2d(geometries), names)
+
+    def _query(self, geometries):
+        """
+        Paires (indice requête, indice polygone) qui s'intersectent.
+        Le STRtree filtre sur les emprises, puis le prédicat est évalué côté
+        polygone préparé, ce qui est bien plus rapide que côté point.
+        """
+        query_idx, geom_idx = self.tree.query(geometries)
+        hits = shapely.intersects(self.geometries[geom_idx], geometries[query_idx])
+        return query_idx[hits], geom_idx[hits]
+
+    def locate_indices(self, lon, lat, max_distance=None):
+        """
+        Indice du polygone contenant chaque point (-1 si aucun).
+
+        max_distance (en degrés) : les points hors de tout polygone (ex. sur la côte)
+        sont rattachés au polygone le plus proche s'il est à moins de cette distance.
+        """
+        points = shapely.points(np.asarray(lon, dtype=float), np.asarray(lat, dtype=float))
+        points = np.atleast_1d(points)
+        result = np.full(len(points), -1, dtype=np.int64)
+
+        point_idx, geom_idx = self._query(points)
+        # Point sur une frontière commune : on garde le premier polygone trouvé
+        result[point_idx[::-1]] = geom_idx[::-1]
+
+        if max_distance is not None:
+            missing = np.flatnonzero(result == -1)
+            if missing.size:
+                near_idx, near_geom = self.tree.query_nearest(points[missing], max_distance=max_distance)
+                result[missing[near_idx[::-1]]] = near_geom[::-1]
+
+        return result
+
+    def locate(self, lon, lat, max_distance=None):
+        """ Nom du polygone contenant chaque point (None si aucun), en tableau numpy. """
+        indices = self.locate_indices(lon, lat, max_distance=max_distance)
+        names = np.full(len(indices), None, dtype=object)
+        found = indices >= 0
+        names[found] = self.names[indices[found]]
+        return names
+
+    def locate_frame(self, df, lon_col="longitude", lat_col="latitude", max_distance=None):
+        """ Rattache chaque ligne d'un DataFrame (colonnes de coordonnées) à un polygone. """
+        return self.locate(df[lon_col].to_numpy(), df[lat_col].to_numpy(), max_distance=max_distance)
+
+    def query_bbox(self, min_lon, min_lat, max_lon, max_lat):
+        """
+        Polygones intersectant chaque emprise (bornes scalaires ou tableaux).
+        Retourne une liste (une entrée par emprise) de listes de noms.
+        """
+        boxes = np.atleast_1d(shapely.box(min_lon, min_lat, max_lon, max_lat))
+        box_idx, geom_idx = self._query(boxes)
+
+        matches = [[] for _ in range(len(boxes))]
+        for b, g in zip(box_idx, geom_idx):
+            matches[b].append(self.names[g])
+        return matches
+
+
+@lru_cache(maxsize=4)
+def _load_index(path, key, mtime_ns, size):
+    # mtime_ns et size ne servent qu'à invalider le cache quand le fichier change
+    return SpatialIndex.from_geojson(path, key=key)
+
+
+def get_spatial_index(path, key="PLN_AREA_N"):
+    """ Index spatial d'un GeoJSON, construit une seule fois par version du fichier. """
+    stat = os.stat(path)
+    return _load_index(path, key, stat.st_mtime_ns, stat.st_size)
+
+
+def get_planning_area_index():
+    """ Index des 55 planning areas (PLN_AREA_N). """
+    return get_spatial_index(PLANNING_AREA_GEOJSON, key="PLN_AREA_N")
+
+
+def get_subzone_index():
+    """ Index des subzones (SUBZONE_N). """
+    return get_spatial_index(SUBZONE_GEOJSON, key="SUBZONE_N")
@@ -0,0 +1,165 @@
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+
+from flask import abort, redirect, request, send_file, send_from_directory
+
+try:
+    import brotli
+except ImportError:  # brotli est optionnel : sans lui, seules les versions gzip sont servies
+    brotli = None
+
+# Cartes Folium publiées, indexées par un nom court
+MAP_SOURCES = {
+    "resale": "services/maps/folium_map_resale.html",
+    "price": "services/maps/folium_map_price.html",
+    "salary": "services/maps/working_residents_salary_pop_map.html",
+}
+
+STATIC_MAPS_DIR = "services/maps/static"
+MANIFEST_PATH = os.path.join(STATIC_MAPS_DIR, "manifest.json")
+MAPS_URL_PREFIX = "/maps"
+
+# Les noms de fichiers contiennent le hash du contenu : ils peuvent être mis en cache indéfiniment
+CACHE_MAX_AGE = 365 * 24 * 3600
+
+
+def _write_atomic(path, data):
+    # Écriture atomique : un worker ne lit jamais un fichier à moitié écrit
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    # mkstemp crée le fichier en 0600 : les fichiers publiés doivent être lisibles par le serveur
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def publish_maps(sources=MAP_SOURCES, output_dir=STATIC_MAPS_DIR):
+    """
+    Copie chaque carte HTML sous un nom contenant le hash de son contenu
+    (ex. folium_map_resale.3f2a9c1b7d4e.html), avec ses versions .gz et .br
+    pré-compressées, puis écrit le manifest nom court -> fichier publié.
+    Les fichiers des versions précédentes sont supprimés.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {}
+
+    for name, source in sources.items():
+        with open(source, "rb") as f:
+            content = f.read()
+
+        stem = os.path.splitext(os.path.basename(source))[0]
+        filename = f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}.html"
+        path = os.path.join(output_dir, filename)
+
+        if not os.path.exists(path):
+            _write_atomic(path, content)
+            _write_atomic(path + ".gz", gzip.compress(content, compresslevel=9))
+            if brotli is not None:
+                _write_atomic(path + ".br", brotli.compress(content, quality=11))
+        manifest[name] = filename
+
+    _write_atomic(os.path.join(output_dir, "manifest.json"), json.dumps(manifest, indent=2).encode("utf-8"))
+
+    published = set(manifest.values())
+    for filename in os.listdir(output_dir):
+        base = filename.removesuffix(".gz").removesuffix(".br")
+        if base.endswith(".html") and base not in published:
+            # Un autre processus a pu supprimer le fichier entre-temps
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(output_dir, filename))
+
+    return manifest
+
+
+def get_maps_manifest(path=MANIFEST_PATH):
+    """
+    Manifest des cartes publiées, relu seulement quand le fichier change (mtime, taille).
+    Les cartes sont publiées par le build (python -m services.build static_maps),
+    jamais pendant le traitement d'une requête. Retourne {} si elles ne l'ont pas été.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    return _load_manifest(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=2)
+def _load_manifest(path, mtime_ns, size):
+    # mtime_ns et size ne servent qu'à invalider le cache quand le build republie les cartes
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def get_map_url(name):
+    """
+    Retourne l'URL stable de la carte demandée, à utiliser dans les layouts.
+
+    Elle redirige vers le fichier publié courant (nom versionné par le hash du contenu,
+    mis en cache indéfiniment) : les layouts construits une fois et leurs snapshots ne
+    gardent donc aucun hash, et une republication pendant que les workers tournent
+    ne laisse pas d'URL vers un fichier supprimé.
+    """
+    return f"{MAPS_URL_PREFIX}/latest/{name}"
+
+
+def register_static_maps(server, url_prefix=MAPS_URL_PREFIX, directory=STATIC_MAPS_DIR):
+    """
+    Ajoute au serveur Flask la route qui sert les cartes publiées, avec des en-têtes
+    de cache longue durée et la version pré-compressée acceptée par le navigateur.
+    """
+    directory = os.path.abspath(directory)
+
+    @server.route(f"{url_prefix}/latest/<name>", endpoint="static_map_latest")
+    def serve_latest_map(name):
+        if name not in MAP_SOURCES:
+            abort(404)
+        filename = get_maps_manifest(os.path.join(directory, os.path.basename(MANIFEST_PATH))).get(name)
+        if filename is None:
+            # Repli pour le développement, quand les cartes n'ont pas encore été publiées
+            response = send_file(os.path.abspath(MAP_SOURCES[name]), mimetype="text/html", max_age=0)
+        else:
+            response = redirect(f"{url_prefix}/{filename}", code=302)
+        # La cible change à chaque publication : la redirection n'est jamais mise en cache
+        response.cache_control.no_cache = True
+        response.cache_control.max_age = 0
+        return response
+
+    @server.route(f"{url_prefix}/<path:filename>", endpoint="static_maps")
+    def serve_static_map(filename):
+        if filename == os.path.basename(MANIFEST_PATH):
+            # Le manifest change à chaque publication : pas de cache longue durée
+            response = send_from_directory(directory, filename, max_age=0)
+            response.cache_control.no_cache = True
+            return response
+
+        # Qualité > 0 : "br;q=0" refuse explicitement brotli
+        encoding = None
+        for candidate, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if request.accept_encodings[candidate] > 0 and os.path.exists(os.path.join(directory, filename + suffix)):
+                encoding = candidate
+                break
+
+        if encoding is None:
+            response = send_from_directory(directory, filename, max_age=CACHE_MAX_AGE)
+        else:
+            response = send_from_directory(
+                directory, filename + (".br" if encoding == "br" else ".gz"),
+                mimetype="text/html", max_age=CACHE_MAX_AGE,
+            )
+            response.headers["Content-Encoding"] = encoding
+
+        response.headers["Vary"] = "Accept-Encoding"
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+    return serve_static_map
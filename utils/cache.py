@@ -0,0 +1,174 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Cache mémoire LRU avec expiration (TTL), partagé entre les threads d'un worker.
+
+    Paramètres :
+      - maxsize : nombre maximal d'entrées conservées (les moins récemment utilisées sont évincées).
+      - ttl : durée de vie d'une entrée en secondes (None = pas d'expiration).
+    """
+
+    def __init__(self, maxsize=256, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskStore:
+    """
+    Stockage clé/valeur (texte) sur disque local, partageable entre les workers gunicorn.
+
+    Chaque entrée est un fichier nommé par le hash de sa clé. L'écriture passe par
+    un fichier temporaire puis os.replace, ce qui la rend atomique : un worker ne
+    lit jamais une entrée à moitié écrite. L'expiration se base sur le mtime du fichier.
+
+    Le dossier est borné : les entrées expirées sont supprimées, et au-delà de
+    max_entries fichiers ou de max_bytes octets (None = sans limite), les entrées
+    les plus anciennes sont évincées. Ce nettoyage parcourt le dossier toutes les
+    prune_interval écritures d'un worker, pour ne pas le faire à chaque écriture.
+    """
+
+    def __init__(self, directory, ttl=None, suffix=".json", max_entries=None, max_bytes=None, prune_interval=16):
+        self.directory = directory
+        self.ttl = ttl
+        self.suffix = suffix
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self._writes = 0
+        self._prune_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + self.suffix)
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+                self._remove(path)
+                return default
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return default
+
+    def set(self, key, value):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with self._prune_lock:
+            self._writes += 1
+            due = self._writes % self.prune_interval == 0
+        if due:
+            self._prune()
+
+    @staticmethod
+    def _remove(path):
+        # Un autre worker a pu supprimer l'entrée entre-temps
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _prune(self):
+        """ Supprime les entrées expirées puis les plus anciennes au-delà des limites. """
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                    self._remove(entry.path)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            if ((self.max_entries is None or count <= self.max_entries)
+                    and (self.max_bytes is None or total_bytes <= self.max_bytes)):
+                break
+            self._remove(path)
+            count -= 1
+            total_bytes -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                os.remove(os.path.join(self.directory, name))
+
+
+class CacheStats:
+    """ Compteurs de hits/misses, sûrs entre threads. """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def as_dict(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
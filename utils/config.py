@@ -1,5 +1,27 @@
+import os
+
 GITHUB_LINK = "https://github.com/Hisqkq/Open-Data-City"  
 
+# STARTUP_PROFILE=1 : chronométrage des imports et des layouts au démarrage (voir utils/startup_profile.py)
+STARTUP_PROFILE = os.environ.get("STARTUP_PROFILE") == "1"
+
+# Cache des figures Plotly (nombre d'entrées, durée de vie en secondes, dossier partagé optionnel
+# et taille maximale de ce dossier, qui peut être en mémoire : /dev/shm)
+FIGURE_CACHE_SIZE = 256
+FIGURE_CACHE_TTL = 3600
+FIGURE_CACHE_DIR = os.environ.get("FIGURE_CACHE_DIR")
+FIGURE_CACHE_DISK_BYTES = int(os.environ.get("FIGURE_CACHE_DISK_BYTES", 256 * 1024 * 1024))
+
+# Cache des prédictions immobilières (même principe que le cache des figures)
+PREDICTION_CACHE_SIZE = 4096
+PREDICTION_CACHE_TTL = 24 * 3600
+PREDICTION_CACHE_DIR = os.environ.get("PREDICTION_CACHE_DIR")
+PREDICTION_CACHE_DISK_ENTRIES = int(os.environ.get("PREDICTION_CACHE_DISK_ENTRIES", 20000))
+
+# Vues filtrées / triées gardées en mémoire par l'explorateur de données (/data)
+DATA_QUERY_CACHE_SIZE = 64
+DATA_PAGE_SIZE = 10
+
 NAV_LINKS = {
     "Home": ["/", "bi:house-door-fill"],
     "Topics": {
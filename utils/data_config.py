@@ -1,10 +1,46 @@
 import json
-import pandas as pd
+import os
+from functools import lru_cache
 
-def load_data_config(json_path="assets/data_config.json"):
+from services.data.dataset_registry import read_dataset
+
+DATA_CONFIG_PATH = "assets/data_config.json"
+
+REQUIRED_FIELDS = ("id", "name", "csv_path", "description", "source_link")
+
+
+def _validate(datasets):
+    errors = []
+    seen = set()
+    for position, d in enumerate(datasets):
+        missing = [field for field in REQUIRED_FIELDS if not d.get(field)]
+        if missing:
+            errors.append(f"dataset #{position} ({d.get('id', '?')}): missing {', '.join(missing)}")
+        if d.get("id") in seen:
+            errors.append(f"dataset #{position}: duplicate id {d['id']!r}")
+        seen.add(d.get("id"))
+    if errors:
+        raise ValueError("Invalid data config: " + "; ".join(errors))
+
+
+@lru_cache(maxsize=2)
+def _load_catalog(json_path, mtime_ns, size):
+    # mtime_ns et size ne servent qu'à recharger le catalogue quand le JSON change
     with open(json_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
-    return config["datasets"]
+        datasets = json.load(f)["datasets"]
+    _validate(datasets)
+    return tuple(datasets), {d["id"]: d for d in datasets}
+
+
+def _catalog(json_path=DATA_CONFIG_PATH):
+    stat = os.stat(json_path)
+    return _load_catalog(json_path, stat.st_mtime_ns, stat.st_size)
+
+
+def load_data_config(json_path=DATA_CONFIG_PATH):
+    """ Liste des jeux de données déclarés (JSON lu une seule fois par version du fichier). """
+    return list(_catalog(json_path)[0])
+
 
 def get_grouped_dataset_options():
     datasets = load_data_config()
@@ -18,15 +54,46 @@ def get_grouped_dataset_options():
     return options
 
 def get_dataset_by_id(dataset_id):
-    datasets = load_data_config()
-    for d in datasets:
-        if d["id"] == dataset_id:
-            return d
-    return None
+    return _catalog()[1].get(dataset_id)
 
 def load_dataset(dataset_id):
     dataset = get_dataset_by_id(dataset_id)
     if dataset:
-        return pd.read_csv(dataset["csv_path"])
+        return read_dataset(dataset["csv_path"])
     else:
         raise ValueError("Dataset not found")
+
+
+@lru_cache(maxsize=64)
+def _csv_metadata(csv_path, mtime_ns, size):
+    df = read_dataset(csv_path)
+    return {
+        "columns": list(df.columns),
+        "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
+        "rows": len(df),
+        "bytes": size,
+    }
+
+
+def get_dataset_metadata(dataset_id):
+    """
+    Schéma (colonnes, types), nombre de lignes et taille du fichier d'un jeu de données.
+    Calculé une fois par version du CSV ; None si le fichier est absent.
+    """
+    dataset = get_dataset_by_id(dataset_id)
+    if not dataset or not os.path.exists(dataset["csv_path"]):
+        return None
+    stat = os.stat(dataset["csv_path"])
+    return _csv_metadata(dataset["csv_path"], stat.st_mtime_ns, stat.st_size)
+
+
+def get_catalog_totals():
+    """ Totaux du catalogue : jeux de données, disponibles, lignes et octets. """
+    metadata = [get_dataset_metadata(d["id"]) for d in load_data_config()]
+    available = [m for m in metadata if m is not None]
+    return {
+        "datasets": len(metadata),
+        "available": len(available),
+        "rows": sum(m["rows"] for m in available),
+        "bytes": sum(m["bytes"] for m in available),
+    }
@@ -0,0 +1,122 @@
+import functools
+import inspect
+import json
+import os
+
+from utils.cache import TTLCache, DiskStore, CacheStats
+from utils.config import FIGURE_CACHE_SIZE, FIGURE_CACHE_TTL, FIGURE_CACHE_DIR, FIGURE_CACHE_DISK_BYTES
+
+
+_memory = TTLCache(maxsize=FIGURE_CACHE_SIZE, ttl=FIGURE_CACHE_TTL)
+_disk = (DiskStore(FIGURE_CACHE_DIR, ttl=FIGURE_CACHE_TTL, max_bytes=FIGURE_CACHE_DISK_BYTES)
+         if FIGURE_CACHE_DIR else None)
+_stats = {}
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [path, None, None]
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def _data_version(sources, arguments):
+    """
+    Version des fichiers dont dépend la figure : (chemin, mtime, taille) du code du builder,
+    des sources déclarées et des arguments qui désignent un fichier (csv_path, ...).
+    """
+    paths = list(sources) + [value for name, value in sorted(arguments.items())
+                             if name.endswith("_path") and isinstance(value, str)]
+    return [_file_signature(path) for path in paths]
+
+
+def _default_paths(signature):
+    # Fichiers désignés par défaut par les arguments *_path du builder
+    return tuple(parameter.default for name, parameter in signature.parameters.items()
+                 if name.endswith("_path") and isinstance(parameter.default, str))
+
+
+def _make_key(builder, signature, sources, args, kwargs):
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    name = f"{builder.__module__}.{builder.__qualname__}"
+    version = _data_version(sources, bound.arguments)
+    return json.dumps([name, bound.arguments, version], sort_keys=True, default=str)
+
+
+def cached_figure(builder=None, *, sources=()):
+    """
+    Décorateur de mémoïsation pour les fonctions qui construisent une figure Plotly.
+
+    Utilisable seul (@cached_figure) ou avec les fichiers lus par le builder :
+    @cached_figure(sources=["services/data/raw/UnemploymentRate.csv"]).
+
+    La clé est (builder, arguments normalisés, version des données) : la version
+    contient le mtime et la taille du fichier du builder, des sources déclarées et
+    des arguments *_path. Quand un fichier change, les entrées existantes (mémoire
+    et disque) ne sont plus atteintes et la figure est reconstruite.
+    La figure est sérialisée une seule fois en JSON par combinaison d'arguments,
+    puis servie depuis le cache mémoire (LRU + TTL) et, si FIGURE_CACHE_DIR est
+    défini, depuis un stockage disque partagé par tous les workers.
+
+    La fonction décorée retourne un dict (le JSON de la figure), et non un
+    go.Figure : il est directement utilisable comme propriété `figure` d'un
+    dcc.Graph. Pour manipuler un go.Figure, utiliser go.Figure(resultat) ou
+    appeler builder.uncached(...).
+
+    `wrapper.sources` liste les fichiers lus par défaut par le builder (son code,
+    les sources déclarées et les valeurs par défaut des arguments *_path) : les
+    snapshots de layouts (utils.layout_snapshot) en dérivent leur version.
+    """
+    if builder is None:
+        return functools.partial(cached_figure, sources=sources)
+
+    signature = inspect.signature(builder)
+    sources = (inspect.getfile(builder), *sources)
+    stats = _stats.setdefault(f"{builder.__module__}.{builder.__qualname__}", CacheStats())
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        key = _make_key(builder, signature, sources, args, kwargs)
+
+        payload = _memory.get(key)
+        if payload is None and _disk is not None:
+            payload = _disk.get(key)
+            if payload is not None:
+                _memory.set(key, payload)
+
+        if payload is None:
+            stats.miss()
+            payload = builder(*args, **kwargs).to_json()
+            _memory.set(key, payload)
+            if _disk is not None:
+                _disk.set(key, payload)
+        else:
+            stats.hit()
+
+        return json.loads(payload)
+
+    wrapper.uncached = builder
+    wrapper.sources = (*sources, *_default_paths(signature))
+    return wrapper
+
+
+def get_figure_cache_stats():
+    """ Retourne les compteurs hits/misses par builder ainsi que le total. """
+    per_builder = {name: stats.as_dict() for name, stats in _stats.items()}
+    hits = sum(s["hits"] for s in per_builder.values())
+    misses = sum(s["misses"] for s in per_builder.values())
+    return {
+        "builders": per_builder,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+        "entries": len(_memory),
+    }
+
+
+def clear_figure_cache():
+    _memory.clear()
+    if _disk is not None:
+        _disk.clear()
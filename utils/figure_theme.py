@@ -0,0 +1,33 @@
+import plotly.io as pio
+from dash import clientside_callback, ClientsideFunction, Input, Output, State
+
+
+def get_figure_templates():
+    """
+    Retourne les templates Plotly Mantine (clair/sombre) sérialisés, indexés par la valeur de theme-store.
+    Ils sont envoyés une seule fois au navigateur via le dcc.Store "figure-templates".
+    """
+    return {
+        "dark": pio.templates["mantine_dark"].to_plotly_json(),
+        "light": pio.templates["mantine_light"].to_plotly_json(),
+    }
+
+
+def register_template_swap(*graph_ids):
+    """
+    Enregistre, pour chaque dcc.Graph, un clientside_callback qui applique le template
+    du thème courant lorsque theme-store change ou qu'une nouvelle figure arrive.
+
+    Les callbacks serveur construisent donc leurs figures sans dépendre du thème
+    (réponses identiques pour tous les utilisateurs, réutilisables par le cache des
+    figures) et le changement de thème ne déclenche aucun callback serveur.
+    """
+    for graph_id in graph_ids:
+        clientside_callback(
+            ClientsideFunction(namespace="theme", function_name="swapFigureTemplate"),
+            Output(graph_id, "figure", allow_duplicate=True),
+            Input("theme-store", "data"),
+            Input(graph_id, "figure"),
+            State("figure-templates", "data"),
+            prevent_initial_call="initial_duplicate",
+        )
@@ -0,0 +1,201 @@
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from functools import lru_cache
+
+from plotly.io.json import to_json_plotly
+
+SNAPSHOT_DIR = "services/data/processed/layouts"
+
+# Fichiers de données lus par chaque page hors de ses figures mises en cache : les
+# sources des figures @cached_figure de la page s'y ajoutent (voir page_inputs)
+SNAPSHOT_INPUTS = {
+    "pages.economy": [
+        "services/data/raw/OverallUnemploymentRateAnnual.csv",
+        "services/data/raw/annual average resident unemployment rate by age.csv",
+        "services/data/raw/annual average resident unemployment rate by HQA.csv",
+        "services/data/raw/annual average resident unemployment rate by sex.csv",
+        "services/data/processed/CPI_transformed.csv",
+        "services/data/processed/median_income_transformed.csv",
+        "services/data/processed/partial_correlation.npz",
+    ],
+    "pages.education": [
+        "assets/enrolment.txt",
+        "assets/intake.txt",
+    ],
+    "pages.immobilier": [
+        "services/data/raw/immo.csv",
+        "services/data/processed/PriceWithHistory.geojson",
+        "services/data/processed/PriceWithHistory.low.geojson",
+        "services/data/processed/immobilier.csv",
+        "services/data/processed/town_street_index.json",
+    ],
+}
+
+# Modules de figures dont les sources sont déclarées au build (cible layout_snapshots)
+FIGURE_MODULES = ("figures.economy", "figures.education", "figures.immobilier_fig")
+
+# Code qui produit le contenu des layouts : le modifier invalide aussi les snapshots
+CODE_SOURCES = ("services", "utils", "models", "figures", "components")
+
+# Les composants dash.html / dash.dcc gardent dans leur JSON le nom de l'ancien paquet
+_NAMESPACES = {
+    "dash_html_components": "dash.html",
+    "dash_core_components": "dash.dcc",
+}
+
+# Constructeurs de layouts enregistrés par snapshot_layout, indexés par module de page
+_builders = {}
+
+
+def snapshot_path(module_name, directory=SNAPSHOT_DIR):
+    return os.path.join(directory, f"{module_name}.json")
+
+
+@lru_cache(maxsize=512)
+def _content_hash(path, mtime_ns, size):
+    # mtime_ns et size évitent de relire un fichier inchangé ; la version dépend du contenu seul
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _code_files(sources=CODE_SOURCES):
+    for directory in sources:
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    yield os.path.join(root, name)
+
+
+def _figure_sources(namespace):
+    # Fonctions décorées par cached_figure : elles exposent les fichiers qu'elles lisent
+    paths = set()
+    for value in namespace.values():
+        if callable(value) and hasattr(value, "uncached"):
+            paths.update(os.path.relpath(path).replace(os.sep, "/") for path in getattr(value, "sources", ()))
+    return paths
+
+
+def page_inputs(module_name):
+    """
+    Fichiers lus par une page pendant la construction de son layout : SNAPSHOT_INPUTS
+    et les sources des figures mises en cache que le module de la page importe.
+    """
+    module = sys.modules.get(module_name)
+    figure_paths = _figure_sources(vars(module)) if module is not None else set()
+    return sorted(set(SNAPSHOT_INPUTS.get(module_name, [])) | figure_paths)
+
+
+def snapshot_target_inputs(figure_modules=FIGURE_MODULES):
+    """ Entrées de la cible layout_snapshots : fichiers de toutes les pages et de toutes les figures. """
+    paths = {path for inputs in SNAPSHOT_INPUTS.values() for path in inputs}
+    for module_name in figure_modules:
+        paths |= _figure_sources(vars(importlib.import_module(module_name)))
+    return sorted(paths)
+
+
+def data_version(module_name, source_file, inputs=None, code_sources=CODE_SOURCES):
+    """
+    Version du contenu d'un layout : hash sha256 du contenu de ses fichiers de données
+    (page_inputs), du fichier de la page et du code qui le construit (CODE_SOURCES).
+    Indépendante des mtimes : un checkout ou un déploiement ne l'invalide pas.
+    """
+    if inputs is None:
+        inputs = page_inputs(module_name)
+
+    digest = hashlib.sha256()
+    for path in (*inputs, source_file, *_code_files(code_sources)):
+        try:
+            stat = os.stat(path)
+            content = _content_hash(path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            content = None
+        relative = os.path.relpath(path).replace(os.sep, "/")
+        digest.update(f"{relative}:{content}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _rehydrate(value):
+    if isinstance(value, list):
+        # Listes de nombres (coordonnées, séries des figures) : rien à reconstruire
+        if value and isinstance(value[0], (int, float)):
+            return value
+        return [_rehydrate(item) for item in value]
+    if isinstance(value, dict):
+        if value.keys() == {"type", "namespace", "props"}:
+            module = importlib.import_module(_NAMESPACES.get(value["namespace"], value["namespace"]))
+            component = getattr(module, value["type"])
+            return component(**{name: _rehydrate(prop) for name, prop in value["props"].items()})
+        return {key: _rehydrate(item) for key, item in value.items()}
+    return value
+
+
+def save_snapshot(layout, path, version):
+    """ Sérialise un arbre de composants Dash (avec sa version) ; écriture atomique. """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = '{"version":%s,"layout":%s}' % (json.dumps(version), to_json_plotly(layout))
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(payload)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path, version):
+    """ Arbre de composants rechargé depuis le snapshot, ou None s'il est absent ou d'une autre version. """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != version:
+        return None
+    return _rehydrate(snapshot["layout"])
+
+
+def snapshot_layout(builder):
+    """
+    Sert le layout construit par builder depuis son snapshot JSON, s'il correspond
+    à la version courante des données et du code (voir data_version).
+
+    Les snapshots sont écrits uniquement par `python -m services.build layout_snapshots` :
+    sans snapshot à jour, le layout est simplement construit par le worker.
+    """
+    source_file = inspect.getfile(builder)
+    path = snapshot_path(builder.__module__)
+
+    @functools.wraps(builder)
+    def build():
+        layout = load_snapshot(path, data_version(builder.__module__, source_file))
+        if layout is None:
+            layout = builder()
+        return layout
+
+    _builders[builder.__module__] = (builder, source_file)
+    return build
+
+
+def build_layout_snapshots(directory=SNAPSHOT_DIR):
+    """ Construit et sérialise le layout de chaque page enregistrée. Retourne les chemins écrits. """
+    import app  # noqa: F401  (charge les pages, qui enregistrent leurs constructeurs)
+
+    written = []
+    for module_name, (builder, source_file) in sorted(_builders.items()):
+        layout = builder()
+        # Version calculée après la construction : elle tient compte des fichiers
+        # que la construction aurait pu (re)générer
+        version = data_version(module_name, source_file)
+        path = snapshot_path(module_name, directory)
+        save_snapshot(layout, path, version)
+        written.append(path)
+    return written
@@ -0,0 +1,142 @@
+import functools
+import importlib.machinery
+import sys
+import threading
+import time
+
+from utils.config import STARTUP_PROFILE
+
+# Paquets du projet dont l'import est chronométré (les bibliothèques tierces sont ignorées)
+PROFILED_PACKAGES = ("pages", "figures", "services", "models", "utils", "components")
+
+_timings = []
+_timings_lock = threading.Lock()
+_original_exec_module = None
+
+
+def _record(kind, name, seconds, self_seconds=None):
+    with _timings_lock:
+        _timings.append({
+            "kind": kind,
+            "name": name,
+            "seconds": seconds,
+            "self_seconds": seconds if self_seconds is None else self_seconds,
+        })
+
+
+def _is_profiled(module_name, path):
+    # Les pages Dash sont chargées par chemin de fichier, sous le nom "pages.<fichier>"
+    return module_name.split(".")[0] in PROFILED_PACKAGES or "/pages/" in (path or "")
+
+
+def enable_import_profiling():
+    """
+    Chronomètre l'exécution de chaque module du projet (imports et pages Dash).
+
+    SourceFileLoader.exec_module est enveloppé : il est appelé aussi bien par
+    les imports classiques que par dash pour charger le dossier pages/.
+    Le temps propre d'un module exclut celui des modules du projet qu'il importe.
+    """
+    global _original_exec_module
+    if _original_exec_module is not None:
+        return
+
+    original = importlib.machinery.SourceFileLoader.exec_module
+    stack = []
+
+    @functools.wraps(original)
+    def exec_module(loader, module):
+        if not _is_profiled(module.__name__, getattr(loader, "path", None)):
+            return original(loader, module)
+
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(loader, module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            _record("import", module.__name__, elapsed, elapsed - children)
+
+    _original_exec_module = original
+    importlib.machinery.SourceFileLoader.exec_module = exec_module
+
+
+def disable_import_profiling():
+    global _original_exec_module
+    if _original_exec_module is not None:
+        importlib.machinery.SourceFileLoader.exec_module = _original_exec_module
+        _original_exec_module = None
+
+
+def lazy_layout(builder):
+    """
+    Transforme la fonction qui construit le layout d'une page en layout paresseux.
+
+    Dash appelle le layout à chaque navigation vers la page : il est construit à la
+    première demande (et non plus à l'import de la page, au démarrage du worker),
+    puis réutilisé. Les paramètres d'URL transmis par Dash sont ignorés.
+    """
+    lock = threading.Lock()
+    built = []
+
+    @functools.wraps(builder)
+    def layout(**_):
+        if built:
+            return built[0]
+        with lock:
+            if not built:
+                start = time.perf_counter()
+                built.append(builder())
+                elapsed = time.perf_counter() - start
+                _record("layout", builder.__module__, elapsed)
+                if STARTUP_PROFILE:
+                    print(f"⏱️ layout {builder.__module__} construit en {elapsed * 1000:.0f} ms")
+        return built[0]
+
+    return layout
+
+
+def get_startup_timings():
+    with _timings_lock:
+        return list(_timings)
+
+
+def print_startup_report(limit=25):
+    """ Affiche les imports et layouts les plus coûteux (temps propre, en ms). """
+    timings = sorted(get_startup_timings(), key=lambda t: t["self_seconds"], reverse=True)
+    imports = sum(t["self_seconds"] for t in timings if t["kind"] == "import")
+    layouts = sum(t["seconds"] for t in timings if t["kind"] == "layout")
+
+    print(f"{'type':<8}{'module':<45}{'propre (ms)':>12}{'total (ms)':>12}")
+    for t in timings[:limit]:
+        print(f"{t['kind']:<8}{t['name']:<45}{t['self_seconds'] * 1000:>12.1f}{t['seconds'] * 1000:>12.1f}")
+    print(f"Imports du projet : {imports * 1000:.0f} ms, layouts : {layouts * 1000:.0f} ms")
+
+
+def main():
+    """
+    python -m utils.startup_profile : importe l'application en chronométrant chaque
+    module, construit le layout de chaque page, puis affiche le rapport.
+    """
+    import dash
+    # Sous "python -m", ce fichier est __main__ : les pages utilisent l'instance importée
+    from utils import startup_profile
+
+    startup_profile.enable_import_profiling()
+    start = time.perf_counter()
+    import app  # noqa: F401  (l'import construit l'application et charge les pages)
+    boot = time.perf_counter() - start
+
+    for page in dash.page_registry.values():
+        if callable(page["layout"]):
+            page["layout"]()
+
+    startup_profile.print_startup_report()
+    print(f"Démarrage (import de app) : {boot * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
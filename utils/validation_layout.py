@@ -0,0 +1,70 @@
+import sys
+
+from dash.development.base_component import Component
+
+
+def component_ids(value):
+    """
+    Ids des composants d'un arbre, y compris ceux imbriqués dans d'autres
+    propriétés que children.
+    """
+    if isinstance(value, (list, tuple)):
+        return {component_id for item in value for component_id in component_ids(item)}
+    if not isinstance(value, Component):
+        return set()
+
+    ids = set()
+    for prop in value._prop_names:
+        if not hasattr(value, prop):
+            continue
+        if prop == "id":
+            if isinstance(value.id, str):
+                ids.add(value.id)
+        else:
+            ids |= component_ids(getattr(value, prop))
+    return ids
+
+
+def _callback_ids(dependencies):
+    # Ids utilisés par les callbacks. Les ids des callbacks pattern-matching, sérialisés
+    # en JSON ("{...}"), sont ignorés : ils désignent des composants créés dynamiquement.
+    ids = {dependency["id"] for callback in dependencies
+           for dependency in (*callback["inputs"], *callback["state"])}
+    ids |= {output.rsplit(".", 1)[0] for callback in dependencies
+            for output in callback["output"].strip(".").split("...")}
+    return {component_id for component_id in ids if not component_id.startswith("{")}
+
+
+def find_missing_callback_ids(app):
+    """
+    Construit le layout principal et celui de chaque page, puis retourne les ids
+    utilisés par un callback mais absents de tous ces layouts (triés).
+
+    L'application tourne avec suppress_callback_exceptions : Dash ne construit pas
+    toutes les pages à la première requête pour valider les callbacks, chaque page
+    l'est à sa première visite. Cette vérification remplace la sienne.
+    """
+    import dash
+
+    layouts = [app.layout() if callable(app.layout) else app.layout]
+    layouts += [page["layout"]() if callable(page["layout"]) else page["layout"]
+                for page in dash.page_registry.values()]
+
+    dependencies = app.server.test_client().get(app.get_relative_path("/_dash-dependencies")).get_json()
+    return sorted(_callback_ids(dependencies) - component_ids(layouts))
+
+
+def main():
+    """ python -m utils.validation_layout : échoue si un callback vise un id inexistant. """
+    import app
+
+    missing = find_missing_callback_ids(app.app)
+    if missing:
+        print(f"❌ Ids utilisés par des callbacks mais absents des layouts : {', '.join(missing)}")
+        return 1
+    print("✅ Tous les ids des callbacks existent dans les layouts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())